@@ -6,6 +6,7 @@ import logging
 from homepilot.api import AuthError, HomePilotApi
 from homepilot.hub import HomePilotHub
 from homepilot.manager import HomePilotManager
+from homepilot.wallcontroller import HomePilotWallController
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -26,16 +27,33 @@ from homeassistant.helpers.device_registry import (
 )
 from homeassistant.helpers.entity_registry import async_migrate_entries
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    CONF_DEBUG_LOOP_MONITOR,
     CONF_ENABLE_CYCLIC_SCENE_POLLING,
     CONF_INCLUDE_NON_EXECUTABLE_SCENES,
+    CONF_WALL_CONTROLLER_QUIET_END,
+    CONF_WALL_CONTROLLER_QUIET_START,
 )
+from .aggregates import DeviceAggregates
+from .device_states import DeviceStates
+from .firmware import FirmwareUpdateCoordinator
+from .loop_monitor import LoopMonitor
+from .models import RademacherData
+from .profiler import async_register_profiler_service
+from .refresh import RefreshPlanner
+from .response_cache import CachingHomePilotApi, async_get_response_cache
+from .scene_executor import SceneExecutor, async_register_scene_service
+from .scene_index import SceneDeviceIndex
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_REFRESH, BridgeScheduler
+from .snapshot import DeviceSnapshot
+from .wall_controller import WallControllerPoller
 
 # List of platforms to support. There should be a matching .py file for each,
 # eg <cover.py> and <sensor.py>
-PLATFORMS = ["cover", "button", "switch", "sensor", "binary_sensor", "climate", "light", "number", "update", "scene"]
+PLATFORMS = ["cover", "button", "switch", "sensor", "binary_sensor", "climate", "light", "number", "update", "scene", "event"]
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -101,6 +119,8 @@ async def async_setup(hass: HomeAssistant, config: dict):
     # common/preferred as it allows a separate instance of your class for each
     # instance that has been created in the UI.
     hass.data.setdefault(DOMAIN, {})
+    async_register_profiler_service(hass)
+    async_register_scene_service(hass)
 
     return True
 
@@ -110,16 +130,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rademacher from a config entry."""
     # Store an instance of the "connecting" class that does the work of speaking
     # with your actual devices.
-    api = HomePilotApi(
+    api = CachingHomePilotApi(
         entry.data[CONF_HOST],
         entry.data.get(CONF_PASSWORD, ""),
         entry.data.get(CONF_API_VERSION, 1),
+        cache=async_get_response_cache(hass),
     )
 
     try:
         # Check if include non executable scenes is enabled
         include_non_manual = entry.options.get(CONF_INCLUDE_NON_EXECUTABLE_SCENES, False)
-        manager = await HomePilotManager.async_build_manager(api, include_non_manual_executable=include_non_manual)
+        # Descriptions fetched by a recent reload or options flow are reused
+        with api.cached_descriptions():
+            manager = await HomePilotManager.async_build_manager(api, include_non_manual_executable=include_non_manual)
     except AuthError as err:
         # Raising ConfigEntryAuthFailed will cancel future updates
         # and start a config flow with SOURCE_REAUTH (async_step_reauth)
@@ -133,6 +156,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.debug("Device IDs: %s", list(manager.devices))
     _LOGGER.debug("Scene IDs: %s", list(manager.scenes))
 
+    scheduler = BridgeScheduler()
+    device_states = DeviceStates(manager.devices)
+    hub: HomePilotHub | None = next(
+        (device for device in manager.devices.values() if isinstance(device, HomePilotHub)), None
+    )
+
+    async def async_fetch_states():
+        # The firmware status in the hub state is served from the response
+        # cache, the firmware coordinator polls it
+        try:
+            await manager.update_states()
+        except BaseException:
+            # Entities must write their state again after an error
+            device_states.async_invalidate()
+            raise
+        device_states.async_patch()
+        return device_states
+
     async def async_update_data():
         """Fetch data from API endpoint.
 
@@ -144,7 +185,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # handled by the data update coordinator.
             async with asyncio.timeout(10):
                 _LOGGER.info("%s - Updating states for %s devices", entry.title, len(manager.devices))
-                return await manager.update_states()
+                return await scheduler.async_fetch(("states",), PRIORITY_REFRESH, async_fetch_states)
         except AuthError as err:
             # Raising ConfigEntryAuthFailed will cancel future updates
             # and start a config flow with SOURCE_REAUTH (async_step_reauth)
@@ -170,7 +211,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # handled by the data update coordinator.
             async with asyncio.timeout(15):
                 _LOGGER.info("%s - Updating states for %s scenes", entry.title, len(manager.scenes))
-                return await manager.async_update_scenes()
+                return await scheduler.async_fetch(("scenes",), PRIORITY_BACKGROUND, manager.async_update_scenes)
         except AuthError as err:
             # Raising ConfigEntryAuthFailed will cancel future updates
             # and start a config flow with SOURCE_REAUTH (async_step_reauth)
@@ -203,26 +244,95 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if CONF_SENSOR_TYPE not in entry.options:
         entry_options[CONF_SENSOR_TYPE] = []
 
-    hass.data[DOMAIN][entry.entry_id] = (
-        manager,
-        coordinator,
-        entry.data,
-        entry_options,
-        scene_coordinator,
+    aggregates = DeviceAggregates(device_states, entry_options[CONF_EXCLUDE])
+    entry.async_on_unload(device_states.async_add_patch_listener(aggregates.async_update))
+
+    firmware_coordinator = (
+        FirmwareUpdateCoordinator(hass, manager, hub, scheduler) if hub is not None else None
+    )
+
+    loop_monitor: LoopMonitor | None = None
+    if entry.options.get(CONF_DEBUG_LOOP_MONITOR, False):
+        _LOGGER.warning("%s - Event loop monitor enabled, this slows down the integration", entry.title)
+        loop_monitor = LoopMonitor()
+        for monitored_coordinator in (coordinator, scene_coordinator, firmware_coordinator):
+            if monitored_coordinator is not None:
+                loop_monitor.instrument_coordinator(monitored_coordinator)
+
+    scene_index = SceneDeviceIndex(hass, entry)
+    await scene_index.async_load(manager.scenes, manager.devices)
+
+    @callback
+    def async_prune_scene_index() -> None:
+        # Scenes no longer listed by the bridge are unavailable
+        if scene_coordinator.last_update_success:
+            for sid, scene in manager.scenes.items():
+                if not scene.available:
+                    scene_index.async_remove_scene(sid)
+
+    quiet_start = dt_util.parse_time(entry.options.get(CONF_WALL_CONTROLLER_QUIET_START) or "")
+    quiet_end = dt_util.parse_time(entry.options.get(CONF_WALL_CONTROLLER_QUIET_END) or "")
+
+    hass.data[DOMAIN][entry.entry_id] = RademacherData(
+        manager=manager,
+        coordinator=coordinator,
+        config=entry.data,
+        options=entry_options,
+        scene_coordinator=scene_coordinator,
+        refresh_planner=RefreshPlanner(hass, coordinator),
+        scheduler=scheduler,
+        firmware_coordinator=firmware_coordinator,
+        wall_controller_poller=WallControllerPoller(
+            hass,
+            scheduler,
+            {
+                did: device
+                for did, device in manager.devices.items()
+                if isinstance(device, HomePilotWallController)
+            },
+            (quiet_start, quiet_end) if quiet_start is not None and quiet_end is not None else None,
+        ),
+        loop_monitor=loop_monitor,
+        scene_executor=SceneExecutor(hass, entry, manager, coordinator, scheduler, scene_index),
+        scene_index=scene_index,
+        aggregates=aggregates,
     )
 
-    await coordinator.async_config_entry_first_refresh()
-    await scene_coordinator.async_config_entry_first_refresh()
+    snapshot = DeviceSnapshot(hass, entry)
+    if await snapshot.async_restore(manager.devices):
+        # Entities start with the restored states, marked as assumed, and
+        # the first refresh replaces them once it completes
+        _LOGGER.info("%s - Restored last known states, refreshing in the background", entry.title)
+        device_states.async_mark_restored()
+        coordinator.async_set_updated_data(device_states)
+        entry.async_create_background_task(hass, coordinator.async_refresh(), "rademacher first refresh")
+        # Scenes are built with their current state
+        scene_coordinator.async_set_updated_data(manager.scenes)
+        if firmware_coordinator is not None:
+            firmware_coordinator.device_states.async_mark_restored()
+            firmware_coordinator.async_set_updated_data(firmware_coordinator.device_states)
+            entry.async_create_background_task(
+                hass, firmware_coordinator.async_refresh(), "rademacher first firmware refresh"
+            )
+    else:
+        await async_first_refresh(
+            coordinator,
+            scene_coordinator,
+            *([firmware_coordinator] if firmware_coordinator is not None else []),
+        )
+
+    if loop_monitor is not None:
+        # Started once setup can no longer be retried, which would leak the watchdog thread
+        loop_monitor.start()
 
+    entry.async_on_unload(coordinator.async_add_listener(snapshot.async_schedule_save))
+    if firmware_coordinator is not None:
+        entry.async_on_unload(firmware_coordinator.async_add_listener(snapshot.async_schedule_save))
+    entry.async_on_unload(scene_coordinator.async_add_listener(async_prune_scene_index))
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     # Deleting excluded devices
-    device_registry: DeviceRegistry = dr.async_get(hass)
-    for did in entry.options[CONF_EXCLUDE]:
-        device_entry: DeviceEntry = device_registry.async_get_device({(DOMAIN, did)})
-        if device_entry is not None:
-            _LOGGER.info("Deleting device %s", did)
-            device_registry.async_remove_device(device_entry.id)
+    async_remove_excluded_devices(hass, entry, entry_options[CONF_EXCLUDE])
 
     _LOGGER.info("Starting entry setup for each platform")
     # This creates each HA object for each platform your device requires.
@@ -231,11 +341,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_first_refresh(*coordinators: DataUpdateCoordinator) -> None:
+    """Run the first refresh of the coordinators concurrently.
+
+    An authentication failure takes precedence over other errors, so the
+    reauth flow is started whichever coordinator ran into it.
+    """
+    results = await asyncio.gather(
+        *(coordinator.async_config_entry_first_refresh() for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    for err in errors:
+        if isinstance(err, ConfigEntryAuthFailed):
+            raise err
+    if errors:
+        raise errors[0]
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
 
 
+@callback
+def async_remove_excluded_devices(hass: HomeAssistant, entry: ConfigEntry, exclude_devices: list[str]):
+    """Remove registry devices of excluded device IDs in a single pass.
+
+    Entities of a removed device are dropped by the entity registry together
+    with it. Nothing is touched when no excluded device is registered, so
+    normal restarts don't trigger any registry writes.
+    """
+    if not exclude_devices:
+        return
+    hub_mac = entry.unique_id or "unknown"
+    excluded_identifiers = set()
+    for did in exclude_devices:
+        # Old identifier format was the bare device ID
+        excluded_identifiers.add((DOMAIN, did))
+        excluded_identifiers.add((DOMAIN, f"{hub_mac}_{did}"))
+
+    device_registry: DeviceRegistry = dr.async_get(hass)
+    orphaned_devices: list[DeviceEntry] = [
+        device_entry
+        for device_entry in dr.async_entries_for_config_entry(device_registry, entry.entry_id)
+        if not device_entry.identifiers.isdisjoint(excluded_identifiers)
+    ]
+    if not orphaned_devices:
+        return
+
+    _LOGGER.info("%s - Deleting %s excluded device(s)", entry.title, len(orphaned_devices))
+    for device_entry in orphaned_devices:
+        _LOGGER.debug("Deleting device %s", device_entry.identifiers)
+        device_registry.async_remove_device(device_entry.id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Unload a config entry."""
     # This is called when an entry/configured device is to be removed. The class
@@ -243,8 +403,20 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     # details
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        manager, _, _, _, _ = hass.data[DOMAIN].pop(entry.entry_id)
+        data: RademacherData = hass.data[DOMAIN].pop(entry.entry_id)
+        data.refresh_planner.async_shutdown()
+        data.wall_controller_poller.async_shutdown()
+        if data.loop_monitor is not None:
+            data.loop_monitor.stop()
+        if data.firmware_coordinator is not None:
+            await data.firmware_coordinator.async_shutdown()
         # Close the API session
-        await manager.api.async_close()
+        await data.manager.api.async_close()
 
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted data of a config entry."""
+    await DeviceSnapshot(hass, entry).async_remove()
+    await SceneDeviceIndex(hass, entry).async_remove()
@@ -0,0 +1,94 @@
+"""Hub-level aggregates of the device states of Rademacher Bridge."""
+import heapq
+from collections.abc import Iterable
+
+from homepilot.cover import HomePilotCover
+from homepilot.device import HomePilotDevice
+from homepilot.sensor import ContactState
+
+from homeassistant.core import callback
+
+from .device_states import DeviceStates
+
+
+def _set_member(members: set[str], did: str, is_member: bool) -> None:
+    if is_member:
+        members.add(did)
+    else:
+        members.discard(did)
+
+
+class DeviceAggregates:
+    """Counts and extremes over all devices, updated from the changed devices only.
+
+    After every refresh only the devices with changed fields are looked at:
+    the sets of open covers, open contacts and detected obstacles are
+    updated by adding or removing those devices, and the lowest battery
+    level is kept in a heap whose outdated entries are dropped lazily.
+    Unavailable devices do not count.
+    """
+
+    def __init__(self, device_states: DeviceStates, exclude_devices: Iterable[str]) -> None:
+        excluded = set(exclude_devices)
+        self._devices: dict[str, HomePilotDevice] = {
+            did: device for did, device in device_states.items() if did not in excluded
+        }
+        self._device_states = device_states
+        self.covers = frozenset(
+            did for did, device in self._devices.items() if isinstance(device, HomePilotCover)
+        )
+        self.contacts = frozenset(
+            did for did, device in self._devices.items() if getattr(device, "has_contact_state", False)
+        )
+        self.obstacle_detectors = frozenset(
+            did for did in self.covers if getattr(self._devices[did], "has_obstacle_detection", False)
+        )
+        self.batteries = frozenset(
+            did for did, device in self._devices.items() if getattr(device, "has_battery_level", False)
+        )
+        self.open_covers: set[str] = set()
+        self.open_contacts: set[str] = set()
+        self.obstacles: set[str] = set()
+        self._battery_levels: dict[str, int] = {}
+        self._battery_heap: list[tuple[int, str]] = []
+
+    @callback
+    def async_update(self) -> None:
+        """Apply the fields changed by the last refresh."""
+        for did in self._device_states.changed_devices:
+            if (device := self._devices.get(did)) is not None:
+                self._update_device(did, device)
+
+    def _update_device(self, did: str, device: HomePilotDevice) -> None:
+        # State fields are not set until the first refresh of the device
+        available = getattr(device, "available", False)
+        if did in self.covers:
+            _set_member(self.open_covers, did, available and getattr(device, "is_closed", None) is False)
+        if did in self.contacts:
+            _set_member(
+                self.open_contacts,
+                did,
+                available
+                and getattr(device, "contact_state_value", None) in (ContactState.OPEN, ContactState.TILTED),
+            )
+        if did in self.obstacle_detectors:
+            _set_member(self.obstacles, did, available and getattr(device, "obstacle_detection_status", False))
+        if did in self.batteries:
+            level = getattr(device, "battery_level_value", None) if available else None
+            if level is None:
+                self._battery_levels.pop(did, None)
+            elif self._battery_levels.get(did) != level:
+                self._battery_levels[did] = level
+                heapq.heappush(self._battery_heap, (level, did))
+                if len(self._battery_heap) > 2 * len(self._battery_levels) + 16:
+                    # Too many outdated entries, rebuild from the current levels
+                    self._battery_heap = [(level, did) for did, level in self._battery_levels.items()]
+                    heapq.heapify(self._battery_heap)
+
+    @property
+    def lowest_battery(self) -> tuple[int, str] | None:
+        """Lowest battery level, with the device reporting it."""
+        heap = self._battery_heap
+        while heap and self._battery_levels.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
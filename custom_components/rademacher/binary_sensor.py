@@ -1,9 +1,10 @@
 """Platform for Rademacher Bridge."""
-from datetime import timedelta
 import logging
+from operator import attrgetter
 
 from homepilot.cover import HomePilotCover
 from homepilot.device import HomePilotDevice
+from homepilot.hub import HomePilotHub
 from homepilot.manager import HomePilotManager
 from homepilot.sensor import HomePilotSensor
 from homepilot.wallcontroller import HomePilotWallController
@@ -15,23 +16,27 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EXCLUDE, CONF_SENSOR_TYPE
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .aggregates import DeviceAggregates
 from .const import DOMAIN
-from .entity import HomePilotEntity
+from .entity import HomePilotAggregateEntity, HomePilotEntity
+from .models import RademacherData
+from .wall_controller import ChannelPress, WallControllerPoller
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry: ConfigEntry, async_add_entities):
     """Setup of entities for binary_sensor platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
-    ternary_contact_sensors: list[str] = entry[3][CONF_SENSOR_TYPE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
+    ternary_contact_sensors: list[str] = entry.options[CONF_SENSOR_TYPE]
+    aggregates: DeviceAggregates = entry.aggregates
     new_entities = []
 
     for did in manager.devices:
@@ -238,8 +243,7 @@ async def async_setup_entry(hass, config_entry: ConfigEntry, async_add_entities)
                                 name_suffix=channel,
                                 value_attr=f"channel_{channel}",
                                 device_class=BinarySensorDeviceClass.RUNNING,
-                                has_channels=True,
-                                should_poll=channel == 1 #Only the first Channel needs to poll data of device
+                                poller=entry.wall_controller_poller,
                             )
                         )
                 else:
@@ -259,6 +263,34 @@ async def async_setup_entry(hass, config_entry: ConfigEntry, async_add_entities)
                             entity_category=EntityCategory.DIAGNOSTIC,
                         )
                     )
+            if isinstance(device, HomePilotHub) and aggregates.contacts:
+                _LOGGER.info("Found Any Window Open Sensor for Device ID: %s", device.did)
+                new_entities.append(
+                    HomePilotAggregateBinarySensorEntity(
+                        coordinator,
+                        device,
+                        aggregates,
+                        key="any_window_open",
+                        name="Any Window Open",
+                        value_fn=lambda aggregates: len(aggregates.open_contacts),
+                        attributes_fn=lambda aggregates: {"device_ids": sorted(aggregates.open_contacts)},
+                        device_class=BinarySensorDeviceClass.WINDOW,
+                    )
+                )
+            if isinstance(device, HomePilotHub) and aggregates.obstacle_detectors:
+                _LOGGER.info("Found Any Obstacle Detected Sensor for Device ID: %s", device.did)
+                new_entities.append(
+                    HomePilotAggregateBinarySensorEntity(
+                        coordinator,
+                        device,
+                        aggregates,
+                        key="any_obstacle_detected",
+                        name="Any Obstacle Detected",
+                        value_fn=lambda aggregates: len(aggregates.obstacles),
+                        attributes_fn=lambda aggregates: {"device_ids": sorted(aggregates.obstacles)},
+                        device_class=BinarySensorDeviceClass.PROBLEM,
+                    )
+                )
     # If we have any new devices, add them
     if new_entities:
         async_add_entities(new_entities)
@@ -278,8 +310,7 @@ class HomePilotBinarySensorEntity(HomePilotEntity, BinarySensorEntity):
         entity_category=None,
         icon_on=None,
         icon_off=None,
-        has_channels=False,
-        should_poll=True,
+        poller: WallControllerPoller | None = None,
         entity_registry_enabled_default=True,
     ):
         super().__init__(
@@ -292,35 +323,21 @@ class HomePilotBinarySensorEntity(HomePilotEntity, BinarySensorEntity):
             entity_registry_enabled_default=entity_registry_enabled_default,
         )
         self._value_attr = value_attr
+        self._tracked_fields = (value_attr,)
+        self._get_value = attrgetter(value_attr)
         self._icon_on = icon_on
         self._icon_off = icon_off
-        self._has_channels = has_channels
-        self._should_poll = should_poll
+        self._poller = poller
 
     async def async_added_to_hass(self) -> None:
-        """Set up a timer for updating."""
-        if self._has_channels:
-            self.async_on_remove(
-                async_track_time_interval(
-                    self.hass, self._data_refresh, timedelta(seconds=2)
-                )
-            )
-
-    async def _data_poll(self):
-        _LOGGER.debug("### Pull data for Device ID: %s, %s, entity_id: %s", self.did, self._value_attr, self.entity_id)
-        if isinstance(self.coordinator.data[self.did], HomePilotWallController):
-            device: HomePilotWallController = self.coordinator.data[self.did]
-            await device.update_channels()
-            await self.coordinator.async_request_refresh()
+        await super().async_added_to_hass()
+        if self._poller is not None:
+            self.async_on_remove(self._poller.async_add_listener(self.did, self._async_handle_presses))
 
-    async def _data_refresh(self, event_time):
-        if self._should_poll:
-            await self._data_poll()
-        self.async_write_ha_state()
-
-    @property
-    def should_poll(self):
-        return self._should_poll
+    @callback
+    def _async_handle_presses(self, presses: list[ChannelPress]) -> None:
+        # Channel states are updated outside of the coordinator refresh
+        self._async_publish()
 
     @property
     def value_attr(self):
@@ -331,7 +348,10 @@ class HomePilotBinarySensorEntity(HomePilotEntity, BinarySensorEntity):
 
     @property
     def is_on(self):
-        value = getattr(self.coordinator.data[self.did], self.value_attr)
+        return self._memoized("is_on", self._compute_is_on)
+
+    def _compute_is_on(self):
+        value = self._get_value(self.coordinator.data[self.did])
         return value if isinstance(value, bool) else value.value
 
     @property
@@ -366,6 +386,8 @@ class HomePilotBinaryInternalExternalSensorEntity(HomePilotEntity, BinarySensorE
         )
         self._value_attr_int = f"int_{value_attr}"
         self._value_attr_ext = f"ext_{value_attr}"
+        self._get_values = attrgetter(self._value_attr_int, self._value_attr_ext)
+        self._tracked_fields = (self._value_attr_int, self._value_attr_ext)
         self._icon_on = icon_on
         self._icon_off = icon_off
 
@@ -379,12 +401,23 @@ class HomePilotBinaryInternalExternalSensorEntity(HomePilotEntity, BinarySensorE
 
     @property
     def is_on(self):
-        value_int = getattr(self.coordinator.data[self.did], self.value_attr_int)
-        value_ext = getattr(self.coordinator.data[self.did], self.value_attr_ext)
+        return self._memoized("is_on", self._compute_is_on)
+
+    def _compute_is_on(self):
+        value_int, value_ext = self._get_values(self.coordinator.data[self.did])
         if not isinstance(value_int, bool) or not isinstance(value_ext, bool):
             return value_int + value_ext
         return value_int or value_ext
 
     @property
     def icon(self):
-        return self._icon_on if self.is_on else self._icon_off
\ No newline at end of file
+        return self._icon_on if self.is_on else self._icon_off
+
+
+class HomePilotAggregateBinarySensorEntity(HomePilotAggregateEntity, BinarySensorEntity):
+    """This class represents whether any device of the bridge is in a state."""
+
+    @property
+    def is_on(self):
+        # The aggregate is the number of devices in the state
+        return self.aggregate_value > 0
@@ -14,16 +14,17 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for button platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -172,6 +173,7 @@ class HomePilotButtonEntity(HomePilotEntity, ButtonEntity):
         return True
 
     async def async_press(self) -> None:
-        await self._device_command_method()
+        async with self.command_slot():
+            await self._device_command_method()
         async with asyncio.timeout(5):
             await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -1,5 +1,4 @@
 """Platform for Rademacher Bridge."""
-import asyncio
 import logging
 
 from homepilot.device import HomePilotDevice
@@ -9,20 +8,24 @@ from homepilot.thermostat import HomePilotThermostat
 from homeassistant.components.climate import ClimateEntity
 from homeassistant.components.climate.const import ClimateEntityFeature, HVACMode, HVACAction, PRESET_NONE, PRESET_BOOST
 from homeassistant.const import CONF_EXCLUDE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
+from .refresh import REFRESH_DELAY_THERMOSTAT, REFRESH_RETRY_DELAY
+from .write_cache import WriteThroughCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for sensor platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -68,20 +71,50 @@ class HomePilotClimateEntity(HomePilotEntity, ClimateEntity):
         )
         self._attr_hvac_action = HVACAction.IDLE if device.has_relais_status else None
         self._attr_preset_modes = [PRESET_NONE, PRESET_BOOST] if device.has_boost_active else None
+        self._target_temperature_cache = WriteThroughCache(
+            self._async_write_target_temperature,
+            verify_after=REFRESH_DELAY_THERMOSTAT + REFRESH_RETRY_DELAY,
+            on_failure=self.async_write_ha_state,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._target_temperature_cache.async_clear()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        device: HomePilotThermostat = self.coordinator.data[self.did]
+        if device.has_target_temperature and self._target_temperature_cache.has_value:
+            self._target_temperature_cache.async_verify(device.target_temperature_value)
+            if not self._target_temperature_cache.has_value:
+                self._async_publish()
+                return
+        super()._handle_coordinator_update()
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         device: HomePilotThermostat = self.coordinator.data[self.did]
         if device.has_auto_mode:
-            await device.async_set_auto_mode(hvac_mode == HVACMode.AUTO)
-            async with asyncio.timeout(5):
-                await self.coordinator.async_request_refresh()
+            async with self.command_slot():
+                await device.async_set_auto_mode(hvac_mode == HVACMode.AUTO)
+            self.async_schedule_refresh(
+                REFRESH_DELAY_THERMOSTAT, lambda: self.hvac_mode == hvac_mode
+            )
 
     async def async_set_temperature(self, **kwargs) -> None:
         device: HomePilotThermostat = self.coordinator.data[self.did]
         if device.can_set_target_temperature:
-            await device.async_set_target_temperature(kwargs["temperature"])
-            async with asyncio.timeout(5):
-                await self.coordinator.async_request_refresh()
+            # Sent once the value stopped changing, shown right away
+            self._target_temperature_cache.async_set(self.hass, kwargs["temperature"])
+            self.async_write_ha_state()
+
+    async def _async_write_target_temperature(self, temperature: float) -> None:
+        device: HomePilotThermostat = self.coordinator.data[self.did]
+        async with self.command_slot():
+            await device.async_set_target_temperature(temperature)
+        self.async_schedule_refresh(
+            REFRESH_DELAY_THERMOSTAT,
+            lambda: device.target_temperature_value == temperature,
+        )
 
     @property
     def current_temperature(self) -> float:
@@ -90,6 +123,8 @@ class HomePilotClimateEntity(HomePilotEntity, ClimateEntity):
 
     @property
     def target_temperature(self) -> float:
+        if self._target_temperature_cache.has_value:
+            return self._target_temperature_cache.value
         device: HomePilotThermostat = self.coordinator.data[self.did]
         return (
             device.target_temperature_value if device.has_target_temperature else None
@@ -129,11 +164,14 @@ class HomePilotClimateEntity(HomePilotEntity, ClimateEntity):
         if not device.has_boost_active:
             return
         if preset_mode == PRESET_BOOST:
-            await device.async_set_boost_active_cfg(True)
+            async with self.command_slot():
+                await device.async_set_boost_active_cfg(True)
         else:
-            await device.async_set_boost_active_cfg(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+            async with self.command_slot():
+                await device.async_set_boost_active_cfg(False)
+        self.async_schedule_refresh(
+            REFRESH_DELAY_THERMOSTAT, lambda: self.preset_mode == preset_mode
+        )
 
     @property
     def supported_features(self) -> int:
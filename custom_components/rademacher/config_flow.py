@@ -20,14 +20,21 @@ from homeassistant.const import (
 )
 from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import TimeSelector
 from homeassistant.helpers.device_registry import format_mac
 
 from .const import (
     DOMAIN,
     CONF_ENABLE_CYCLIC_SCENE_POLLING,
     CONF_CREATE_SCENE_ACTIVATION_ENTITIES,
+    CONF_DEBUG_LOOP_MONITOR,
     CONF_INCLUDE_NON_EXECUTABLE_SCENES,
+    CONF_SENSOR_DEADBAND_SCALE,
+    CONF_WALL_CONTROLLER_QUIET_END,
+    CONF_WALL_CONTROLLER_QUIET_START,
+    DEFAULT_SENSOR_DEADBAND_SCALE,
 )
+from .response_cache import CachingHomePilotApi, async_get_response_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,11 +81,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception", exc_info=True)
                 errors["base"] = "unknown"
-        api = HomePilotApi(
-            self.host, self.password, self.api_version
+        api = CachingHomePilotApi(
+            self.host, self.password, self.api_version, cache=async_get_response_cache(self.hass)
         )  # password can be empty if not defined ("")
         try:
-            manager = await HomePilotManager.async_build_manager(api)
+            with api.cached_descriptions():
+                manager = await HomePilotManager.async_build_manager(api)
             self.hostname = await manager.get_nodename()
             if not self.mac_address:
                 self.mac_address = format_mac(await manager.get_hub_macaddress())
@@ -187,7 +195,10 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors = {}
         if user_input is not None:
             try:
-                self.host = socket.gethostbyname(user_input[CONF_HOST])
+                # Name resolution blocks, keep it off the event loop
+                self.host = await self.hass.async_add_executor_job(
+                    socket.gethostbyname, user_input[CONF_HOST]
+                )
                 _LOGGER.info("Starting manual config for IP %s", self.host)
                 conn_test = await HomePilotApi.test_connection(user_input[CONF_HOST])
                 if conn_test == "ok":
@@ -373,18 +384,25 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_ENABLE_CYCLIC_SCENE_POLLING: user_input.get(CONF_ENABLE_CYCLIC_SCENE_POLLING, False),
                 CONF_CREATE_SCENE_ACTIVATION_ENTITIES: user_input.get(CONF_CREATE_SCENE_ACTIVATION_ENTITIES, False),
                 CONF_INCLUDE_NON_EXECUTABLE_SCENES: user_input.get(CONF_INCLUDE_NON_EXECUTABLE_SCENES, False),
+                CONF_WALL_CONTROLLER_QUIET_START: user_input.get(CONF_WALL_CONTROLLER_QUIET_START),
+                CONF_WALL_CONTROLLER_QUIET_END: user_input.get(CONF_WALL_CONTROLLER_QUIET_END),
+                CONF_SENSOR_DEADBAND_SCALE: user_input.get(
+                    CONF_SENSOR_DEADBAND_SCALE, DEFAULT_SENSOR_DEADBAND_SCALE
+                ),
+                CONF_DEBUG_LOOP_MONITOR: user_input.get(CONF_DEBUG_LOOP_MONITOR, False),
             }
             return self.async_create_entry(title=f"{self.hostname} ({self.mac_address})", data=data)
         self.host = self.config_entry.data[CONF_HOST]
         self.password = self.config_entry.data.get(CONF_PASSWORD, "")
         self.api_version = self.config_entry.data.get(CONF_API_VERSION, 1)
-        api = HomePilotApi(
-            self.host, self.password, self.api_version
+        api = CachingHomePilotApi(
+            self.host, self.password, self.api_version, cache=async_get_response_cache(self.hass)
         )  # password can be empty if not defined ("")
         try:
             # Check if include non executable scenes is enabled
             include_non_manual = self.config_entry.options.get(CONF_INCLUDE_NON_EXECUTABLE_SCENES, False)
-            manager = await HomePilotManager.async_build_manager(api, include_non_manual_executable=include_non_manual)
+            with api.cached_descriptions():
+                manager = await HomePilotManager.async_build_manager(api, include_non_manual_executable=include_non_manual)
             self.mac_address = format_mac(await manager.get_hub_macaddress())
             self.hostname = await manager.get_nodename()
             if not manager.devices:
@@ -419,7 +437,11 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
             data_schema_config = self.build_data_schema(
                 manager.devices, previous_excluded_devices, previous_ternary_contact_sensors,
-                previous_enable_scene_polling, previous_create_scene_activation_entities, previous_include_non_executable_scenes
+                previous_enable_scene_polling, previous_create_scene_activation_entities, previous_include_non_executable_scenes,
+                self.config_entry.options.get(CONF_WALL_CONTROLLER_QUIET_START),
+                self.config_entry.options.get(CONF_WALL_CONTROLLER_QUIET_END),
+                self.config_entry.options.get(CONF_DEBUG_LOOP_MONITOR, False),
+                self.config_entry.options.get(CONF_SENSOR_DEADBAND_SCALE, DEFAULT_SENSOR_DEADBAND_SCALE),
             )
 
             return self.async_show_form(step_id="init", data_schema=data_schema_config)
@@ -428,7 +450,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     def build_data_schema(
         self, devices, previous_excluded_devices, previous_ternary_contact_sensors,
-        previous_enable_scene_polling, previous_create_scene_activation_entities, previous_include_non_executable_scenes
+        previous_enable_scene_polling, previous_create_scene_activation_entities, previous_include_non_executable_scenes,
+        previous_quiet_start=None, previous_quiet_end=None, previous_debug_loop_monitor=False,
+        previous_sensor_deadband_scale=DEFAULT_SENSOR_DEADBAND_SCALE,
     ):
         devices_to_exclude = {
             did: f"{devices[did].name} (id: {devices[did].did})" for did in devices
@@ -473,6 +497,35 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ): bool,
             }
         )
+
+        # Wall controllers are polled less often between start and end
+        schema = schema.extend(
+            {
+                vol.Optional(
+                    CONF_WALL_CONTROLLER_QUIET_START, description={"suggested_value": previous_quiet_start}
+                ): TimeSelector(),
+                vol.Optional(
+                    CONF_WALL_CONTROLLER_QUIET_END, description={"suggested_value": previous_quiet_end}
+                ): TimeSelector(),
+            }
+        )
+
+        # Sensor readings changing less than the deadbands times this factor are not recorded
+        schema = schema.extend(
+            {
+                vol.Optional(
+                    CONF_SENSOR_DEADBAND_SCALE, default=previous_sensor_deadband_scale
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            }
+        )
+
+        schema = schema.extend(
+            {
+                vol.Optional(
+                    CONF_DEBUG_LOOP_MONITOR, default=previous_debug_loop_monitor
+                ): bool,
+            }
+        )
         return schema
 
 
@@ -6,3 +6,10 @@ DOMAIN = "rademacher"
 CONF_ENABLE_CYCLIC_SCENE_POLLING = "enable_cyclic_scene_polling"
 CONF_CREATE_SCENE_ACTIVATION_ENTITIES = "create_scene_activation_entities"
 CONF_INCLUDE_NON_EXECUTABLE_SCENES = "include_non_executable_scenes"
+CONF_WALL_CONTROLLER_QUIET_START = "wall_controller_quiet_start"
+CONF_WALL_CONTROLLER_QUIET_END = "wall_controller_quiet_end"
+CONF_DEBUG_LOOP_MONITOR = "debug_loop_monitor"
+CONF_SENSOR_DEADBAND_SCALE = "sensor_deadband_scale"
+
+# Factor applied to the deadbands of the noisy sensors, 0 publishes every change
+DEFAULT_SENSOR_DEADBAND_SCALE = 1.0
@@ -1,6 +1,7 @@
 """Platform for Rademacher Bridge."""
-import asyncio
+from datetime import timedelta
 import logging
+import time
 from typing import Any
 
 from homepilot.cover import CoverType, HomePilotCover
@@ -15,20 +16,36 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.const import CONF_EXCLUDE
+from homeassistant.core import callback
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
+from .refresh import REFRESH_DELAY_COVER_STOP, REFRESH_DELAY_COVER_TILT
 
 _LOGGER = logging.getLogger(__name__)
 
+# Initial guess for a full 0-100 travel until the first motion was observed
+DEFAULT_TRAVEL_TIME = 25.0
+MIN_TRAVEL_TIME = 3.0
+MAX_TRAVEL_TIME = 180.0
+# Weight of a new observation in the learned travel time
+TRAVEL_TIME_SMOOTHING = 0.5
+# Extra time given to the motor before the confirming poll is sent
+CONFIRM_POLL_MARGIN = 2.0
+MOTION_UPDATE_INTERVAL = timedelta(seconds=1)
+# Time (in seconds) without progress after which a running motion is considered stopped
+STALL_TIME = 3.0
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for cover platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -41,6 +58,101 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
         async_add_entities(new_entities)
 
 
+class CoverTravelModel:
+    """Travel-time model of a single cover.
+
+    Learns how long a full 0-100 travel takes from the positions polled
+    during a motion and interpolates the position of a running motion from
+    it. The library never reports a cover as opening or closing, so motions
+    not started by the integration (wall buttons, remotes, scenes) are only
+    known once a poll shows the position changed, and their target is
+    assumed to be the end the cover is heading to.
+    """
+
+    def __init__(self, travel_time: float = DEFAULT_TRAVEL_TIME) -> None:
+        self._travel_time = travel_time
+        self._start_position: int | None = None
+        self._target_position: int | None = None
+        self._start_time: float = 0.0
+        # Position reported by the previous poll of the running motion, and when
+        self._last_sample: tuple[int, float] | None = None
+
+    @property
+    def travel_time(self) -> float:
+        return self._travel_time
+
+    @property
+    def is_moving(self) -> bool:
+        return self._target_position is not None
+
+    @property
+    def target_position(self) -> int | None:
+        return self._target_position
+
+    @property
+    def direction(self) -> int:
+        if not self.is_moving or self._target_position == self._start_position:
+            return 0
+        return 1 if self._target_position > self._start_position else -1
+
+    def start(self, position: int, target_position: int, now: float) -> None:
+        self._start_position = position
+        self._target_position = target_position
+        self._start_time = now
+        self._last_sample = None
+
+    def stop(self) -> None:
+        self._start_position = None
+        self._target_position = None
+
+    def position(self, now: float) -> int | None:
+        """Return the interpolated position of the running motion."""
+        if not self.is_moving:
+            return None
+        travelled = (now - self._start_time) * 100 / self._travel_time
+        if self.direction > 0:
+            return round(min(self._start_position + travelled, self._target_position))
+        return round(max(self._start_position - travelled, self._target_position))
+
+    def remaining_time(self, now: float) -> float:
+        """Return the predicted time until the running motion ends."""
+        if not self.is_moving:
+            return 0.0
+        distance = abs(self._target_position - self._start_position)
+        return max(self._start_time + distance * self._travel_time / 100 - now, 0.0)
+
+    def observe(self, position: int, now: float) -> bool:
+        """Learn from a position reported by the bridge during a motion.
+
+        Return False when the cover stopped before reaching the target, e.g.
+        by a wall button, a remote or an obstacle: the position did not
+        progress since the previous poll, or went the other way.
+        """
+        if not self.is_moving or position == self._target_position:
+            return True
+        if (position - self._start_position) * self.direction < 0:
+            return False
+        if self._last_sample is not None and position == self._last_sample[0]:
+            # Polls close together may both come before the motor moved
+            return now - self._last_sample[1] < STALL_TIME
+        self._last_sample = (position, now)
+        if position != self._start_position:
+            # Intermediate sample of a running motion: it gives the real speed,
+            # so re-anchor the interpolation on it
+            self._learn(abs(position - self._start_position), now - self._start_time)
+            self.start(position, self._target_position, now)
+            self._last_sample = (position, now)
+        return True
+
+    def _learn(self, distance: int, duration: float) -> None:
+        if distance < 10 or duration <= 0:
+            # Short motions are dominated by motor start/stop and poll jitter
+            return
+        observed = min(max(duration * 100 / distance, MIN_TRAVEL_TIME), MAX_TRAVEL_TIME)
+        self._travel_time += TRAVEL_TIME_SMOOTHING * (observed - self._travel_time)
+        _LOGGER.debug("Learned cover travel time: %.1fs", self._travel_time)
+
+
 class HomePilotCoverEntity(HomePilotEntity, CoverEntity):
     """This class represents the Cover entity."""
 
@@ -69,6 +181,14 @@ class HomePilotCoverEntity(HomePilotEntity, CoverEntity):
             )
         if cover.can_set_tilt_position:
             self._supported_features |= CoverEntityFeature.SET_TILT_POSITION
+        self._travel_model = CoverTravelModel()
+        self._unsub_motion_update = None
+        # Position reported by the previous poll
+        self._polled_position: int | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._async_stop_motion()
+        await super().async_will_remove_from_hass()
 
     @property
     def supported_features(self):
@@ -76,6 +196,8 @@ class HomePilotCoverEntity(HomePilotEntity, CoverEntity):
 
     @property
     def current_cover_position(self):
+        if self._travel_model.is_moving:
+            return self._travel_model.position(time.monotonic())
         device: HomePilotCover = self.coordinator.data[self.did]
         return device.cover_position
 
@@ -87,62 +209,123 @@ class HomePilotCoverEntity(HomePilotEntity, CoverEntity):
     @property
     def is_closing(self):
         device: HomePilotCover = self.coordinator.data[self.did]
-        return device.is_closing
+        return device.is_closing or self._travel_model.direction < 0
 
     @property
     def is_opening(self):
         device: HomePilotCover = self.coordinator.data[self.did]
-        return device.is_opening
+        return device.is_opening or self._travel_model.direction > 0
 
     @property
     def is_closed(self):
         device: HomePilotCover = self.coordinator.data[self.did]
         return device.is_closed
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        device: HomePilotCover = self.coordinator.data[self.did]
+        position = device.cover_position
+        previous, self._polled_position = self._polled_position, position
+        if position is not None and self._travel_model.is_moving:
+            now = time.monotonic()
+            if (
+                not self._travel_model.observe(position, now)
+                or position == self._travel_model.target_position
+                or self._travel_model.remaining_time(now) == 0
+            ):
+                self._async_stop_motion()
+                # The interpolated position is replaced by the reported one
+                self._async_publish()
+                return
+        elif (
+            self.coordinator.last_update_success
+            and previous is not None
+            and position is not None
+            and position != previous
+            and 0 < position < 100
+        ):
+            # Moved by a wall button, a remote or a scene, and not at an end
+            # yet: follow the motion towards the end it is heading to
+            self._memo.clear()
+            self._async_start_motion(100 if position > previous else 0)
+            return
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_start_motion(self, target_position: int) -> None:
+        """Interpolate the position locally until the predicted end of travel."""
+        device: HomePilotCover = self.coordinator.data[self.did]
+        self._async_stop_motion()
+        if device.cover_position is None or device.cover_position == target_position:
+            self.async_schedule_refresh(REFRESH_DELAY_COVER_STOP)
+            return
+        now = time.monotonic()
+        self._travel_model.start(device.cover_position, target_position, now)
+        self._unsub_motion_update = async_track_time_interval(
+            self.hass, self._async_motion_update, MOTION_UPDATE_INTERVAL
+        )
+        self.async_schedule_refresh(
+            self._travel_model.remaining_time(now) + CONFIRM_POLL_MARGIN,
+            lambda: self.coordinator.data[self.did].cover_position == target_position,
+        )
+        self.async_write_ha_state()
+
+    @callback
+    def _async_stop_motion(self) -> None:
+        self._travel_model.stop()
+        if self._unsub_motion_update is not None:
+            self._unsub_motion_update()
+            self._unsub_motion_update = None
+
+    @callback
+    def _async_motion_update(self, _now) -> None:
+        self.async_write_ha_state()
+
     async def async_open_cover(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_open_cover()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_open_cover()
+        self._async_start_motion(100)
 
     async def async_close_cover(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_close_cover()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_close_cover()
+        self._async_start_motion(0)
 
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_set_cover_position(kwargs[ATTR_POSITION])
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_cover_position(kwargs[ATTR_POSITION])
+        self._async_start_motion(kwargs[ATTR_POSITION])
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_stop_cover()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_stop_cover()
+        self._async_stop_motion()
+        self.async_schedule_refresh(REFRESH_DELAY_COVER_STOP)
 
     async def async_open_cover_tilt(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_open_cover_tilt()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_open_cover_tilt()
+        self.async_schedule_refresh(REFRESH_DELAY_COVER_TILT)
 
     async def async_close_cover_tilt(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_close_cover_tilt()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_close_cover_tilt()
+        self.async_schedule_refresh(REFRESH_DELAY_COVER_TILT)
 
     async def async_set_cover_tilt_position(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_set_cover_tilt_position(kwargs[ATTR_TILT_POSITION])
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_cover_tilt_position(kwargs[ATTR_TILT_POSITION])
+        self.async_schedule_refresh(REFRESH_DELAY_COVER_TILT)
 
     async def async_stop_cover_tilt(self, **kwargs: Any) -> None:
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_stop_cover_tilt()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_stop_cover_tilt()
+        self.async_schedule_refresh(REFRESH_DELAY_COVER_TILT)
@@ -0,0 +1,135 @@
+"""Device state mapping with change tracking for Rademacher Bridge."""
+from collections.abc import Iterable, Iterator, KeysView, Mapping
+from typing import Any
+
+from homepilot.actuator import HomePilotActuator
+from homepilot.cover import HomePilotCover
+from homepilot.device import HomePilotDevice
+from homepilot.light import HomePilotLight
+from homepilot.switch import HomePilotSwitch
+from homepilot.thermostat import HomePilotThermostat
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+# Marks a device whose fields are all considered changed
+_ALL_FIELDS = frozenset(["*"])
+_MISSING = object()
+
+# Fields of the devices that can be controlled (by commands or scenes) set by them
+_ACTUATOR_FIELDS: dict[type[HomePilotDevice], tuple[str, ...]] = {
+    HomePilotCover: ("cover_position", "cover_tilt_position", "is_closed"),
+    HomePilotSwitch: ("is_on",),
+    HomePilotActuator: ("is_on", "brightness"),
+    HomePilotLight: (
+        "is_on", "brightness", "r_value", "g_value", "b_value", "color_temp_value", "color_mode_value"
+    ),
+    HomePilotThermostat: ("target_temperature_value",),
+}
+
+
+def _copy_value(value: Any) -> Any:
+    # Containers are updated in place by the library, keep a copy to compare with
+    if isinstance(value, (dict, list, set)):
+        return value.copy()
+    return value
+
+
+def actuator_fields(device: HomePilotDevice) -> tuple[str, ...] | None:
+    """Return the controlled fields of the device, None if it is not an actuator."""
+    for device_class, fields in _ACTUATOR_FIELDS.items():
+        if isinstance(device, device_class):
+            return fields
+    return None
+
+
+class DeviceStates(Mapping[str, HomePilotDevice]):
+    """Stable mapping of the long-lived device objects used as coordinator data.
+
+    The library updates the device objects in place on every refresh. After
+    each refresh, async_patch compares the fields of every device with the
+    values seen on the previous refresh and records which ones changed, so
+    entities can skip the state write when none of their fields did.
+    """
+
+    def __init__(self, devices: Mapping[str, HomePilotDevice]) -> None:
+        self._devices = devices
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._changed: dict[str, frozenset[str] | set[str]] = {}
+        # Set while the device states are the ones restored on startup
+        self.restored = False
+        self._patch_listeners: list[CALLBACK_TYPE] = []
+
+    def __getitem__(self, did: str) -> HomePilotDevice:
+        return self._devices[did]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._devices)
+
+    def __len__(self) -> int:
+        return len(self._devices)
+
+    @callback
+    def async_patch(self) -> None:
+        """Record the fields changed by the last refresh."""
+        if self.restored:
+            # Every entity writes its state again to drop the restored flag
+            self.restored = False
+            self._snapshots.clear()
+        self._changed.clear()
+        for did, device in self._devices.items():
+            snapshot = self._snapshots.get(did)
+            if snapshot is None:
+                self._snapshots[did] = {
+                    key: _copy_value(value) for key, value in vars(device).items()
+                }
+                self._changed[did] = _ALL_FIELDS
+                continue
+            changed = None
+            for key, value in vars(device).items():
+                if snapshot.get(key, _MISSING) != value:
+                    snapshot[key] = _copy_value(value)
+                    if changed is None:
+                        changed = self._changed[did] = set()
+                    changed.add(key)
+        for update_callback in list(self._patch_listeners):
+            update_callback()
+
+    @callback
+    def async_add_patch_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback after the changes of a refresh were recorded."""
+        self._patch_listeners.append(update_callback)
+        return lambda: self._patch_listeners.remove(update_callback)
+
+    @callback
+    def async_mark_restored(self) -> None:
+        """Use the restored device states until the first refresh."""
+        self.async_patch()
+        self.restored = True
+
+    @callback
+    def async_invalidate(self) -> None:
+        """Forget the recorded fields, the next refresh reports everything as changed."""
+        self._snapshots.clear()
+        self._changed.clear()
+
+    @property
+    def changed_devices(self) -> KeysView[str]:
+        """Devices with fields changed by the last refresh."""
+        return self._changed.keys()
+
+    def changed(self, did: str, fields: Iterable[str] | None = None) -> bool:
+        """Return whether the device, or one of the given fields of it, changed."""
+        changed = self._changed.get(did)
+        if changed is None:
+            return False
+        if fields is None or changed is _ALL_FIELDS or "_available" in changed:
+            return True
+        snapshot = self._snapshots[did]
+        for field in fields:
+            private = f"_{field}"
+            if field in changed or private in changed:
+                return True
+            if field not in snapshot and private not in snapshot:
+                # Not a plain attribute (e.g. a computed property), can't tell
+                return True
+        return False
@@ -0,0 +1,43 @@
+"""Diagnostics support for Rademacher Bridge."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import RademacherData
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: RademacherData = hass.data[DOMAIN][entry.entry_id]
+    manager = data.manager
+    scheduler = data.scheduler
+    wall_controller_poller = data.wall_controller_poller
+    loop_monitor = data.loop_monitor
+    scene_index = data.scene_index
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "devices": len(manager.devices),
+        "scenes": len(manager.scenes),
+        "scene_devices": {sid: sorted(scene_index.devices(sid)) for sid in manager.scenes if sid in scene_index},
+        "bridge": {
+            "in_flight": scheduler.in_flight,
+            "waiting": scheduler.waiting,
+            "operations": scheduler.statistics(),
+        },
+        "wall_controllers": {
+            "poll_rate": wall_controller_poller.poll_rate,
+            "press_latency": wall_controller_poller.latency_stats,
+        },
+        "loop_monitor": loop_monitor.reports if loop_monitor is not None else None,
+    }
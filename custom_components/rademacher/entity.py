@@ -1,14 +1,23 @@
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
+import inspect
 from typing import Any
 
 from homepilot.device import HomePilotDevice
 
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .aggregates import DeviceAggregates
 from .const import DOMAIN
+from .loop_monitor import LoopMonitor
+from .refresh import RefreshPlanner
+from .scheduler import PRIORITY_COMMAND, BridgeScheduler
 
 
 class HomePilotEntity(CoordinatorEntity):
+    # Device fields the state depends on, None for any field
+    _tracked_fields: tuple[str, ...] | None = None
+
     def __init__(
         self,
         coordinator,
@@ -30,11 +39,76 @@ class HomePilotEntity(CoordinatorEntity):
         self._did = device.did
         self._model = device.model
         self._entity_registry_enabled_default = entity_registry_enabled_default
+        # Values computed from the device state, valid until the next refresh
+        self._memo: dict[str, Any] = {}
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        loop_monitor: LoopMonitor | None = self.hass.data[DOMAIN][self.platform.config_entry.entry_id].loop_monitor
+        if loop_monitor is not None:
+            self._instrument_commands(loop_monitor)
+
+    def _instrument_commands(self, loop_monitor: LoopMonitor) -> None:
+        """Time the command handlers of this integration called by services."""
+        for cls in type(self).__mro__:
+            if not cls.__module__.startswith(__package__):
+                continue
+            for name, attr in vars(cls).items():
+                if (
+                    name.startswith("async_")
+                    and name not in ("async_added_to_hass", "async_will_remove_from_hass")
+                    and name not in vars(self)
+                    and inspect.iscoroutinefunction(attr)
+                ):
+                    setattr(
+                        self,
+                        name,
+                        loop_monitor.wrap_coroutine_function(f"{self.entity_id} {name}", getattr(self, name)),
+                    )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.last_update_success and not self.coordinator.data.changed(
+            self.did, self._tracked_fields
+        ):
+            return
+        self._async_publish()
+
+    @callback
+    def _async_publish(self) -> None:
+        """Write the state from the current device data."""
+        self._memo.clear()
+        super()._handle_coordinator_update()
+
+    def _memoized(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Return compute() evaluated once per coordinator refresh."""
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
 
     @property
     def did(self):
         return self._did
 
+    @property
+    def refresh_planner(self) -> RefreshPlanner:
+        return self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id].refresh_planner
+
+    @property
+    def bridge_scheduler(self) -> BridgeScheduler:
+        return self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id].scheduler
+
+    def command_slot(self):
+        """Bridge slot for a user-triggered command, served before any poll."""
+        return self.bridge_scheduler.slot(PRIORITY_COMMAND)
+
+    @callback
+    def async_schedule_refresh(self, delay: float, is_final: Callable[[], bool] | None = None):
+        """Refresh once the last command is expected to be applied by the device."""
+        self.refresh_planner.async_schedule(self.unique_id, delay, is_final)
+
     @property
     def unique_id(self):
         return self._unique_id
@@ -99,11 +173,80 @@ class HomePilotEntity(CoordinatorEntity):
         device: HomePilotDevice = self.coordinator.data[self.did]
         return device.available
 
+    @property
+    def assumed_state(self) -> bool:
+        # Restored states are shown until the first refresh after startup
+        return self.coordinator.data.restored
+
     @property
     def extra_state_attributes(self) -> Mapping[str, Any]:
-        device: HomePilotDevice = self.coordinator.data[self.did]
-        return getattr(device, "extra_attributes")
+        # A copy, the library updates its dict in place on the next refresh
+        return self._memoized("extra_state_attributes", self._copy_extra_attributes)
+
+    def _copy_extra_attributes(self) -> Mapping[str, Any] | None:
+        attributes = getattr(self.coordinator.data[self.did], "extra_attributes")
+        return dict(attributes) if attributes is not None else None
 
     @property
     def entity_registry_enabled_default(self):
         return self._entity_registry_enabled_default
+
+
+class HomePilotAggregateEntity(HomePilotEntity):
+    """Entity of the hub publishing an aggregate over the devices of the bridge."""
+
+    # The aggregates change with the other devices, not the hub
+    _tracked_fields = ()
+
+    def __init__(
+        self,
+        coordinator,
+        hub: HomePilotDevice,
+        aggregates: DeviceAggregates,
+        key: str,
+        name: str,
+        value_fn: Callable[[DeviceAggregates], Any],
+        attributes_fn: Callable[[DeviceAggregates], Mapping[str, Any]] | None = None,
+        device_class=None,
+        icon=None,
+    ):
+        super().__init__(
+            coordinator,
+            hub,
+            unique_id=f"{hub.uid}_{key}",
+            name=f"{hub.name} {name}",
+            device_class=device_class,
+            icon=icon,
+        )
+        self._aggregates = aggregates
+        self._value_fn = value_fn
+        self._attributes_fn = attributes_fn
+        self._published = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        # The attributes name the devices, which change while a count may not
+        published = (
+            self._value_fn(self._aggregates),
+            self._attributes_fn(self._aggregates) if self._attributes_fn is not None else None,
+        )
+        if (
+            self.coordinator.last_update_success
+            and published == self._published
+            and not self.coordinator.data.changed(self.did, self._tracked_fields)
+        ):
+            return
+        self._published = published
+        self._async_publish()
+
+    @property
+    def aggregate_value(self) -> Any:
+        return self._memoized("aggregate_value", lambda: self._value_fn(self._aggregates))
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        if self._attributes_fn is None:
+            return None
+        return self._memoized(
+            "aggregate_attributes", lambda: self._attributes_fn(self._aggregates)
+        )
@@ -0,0 +1,78 @@
+"""Platform for Rademacher Bridge."""
+import logging
+
+from homepilot.device import HomePilotDevice
+from homepilot.manager import HomePilotManager
+from homepilot.wallcontroller import HomePilotWallController
+
+from homeassistant.components.event import EventDeviceClass, EventEntity
+from homeassistant.const import CONF_EXCLUDE
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+from .entity import HomePilotEntity
+from .models import RademacherData
+from .wall_controller import ChannelPress, WallControllerPoller
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_PRESS = "press"
+
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Setup of entities for event platform."""
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
+    poller: WallControllerPoller = entry.wall_controller_poller
+    new_entities = []
+    for did in manager.devices:
+        if did not in exclude_devices:
+            device: HomePilotDevice = manager.devices[did]
+            if isinstance(device, HomePilotWallController) and device.channels is not None:
+                for channel in device.channels:
+                    _LOGGER.info("Found Wall Controller Button Event %s for Device ID: %s", channel, device.did)
+                    new_entities.append(
+                        HomePilotButtonEventEntity(coordinator, device, poller, channel)
+                    )
+    # If we have any new devices, add them
+    if new_entities:
+        async_add_entities(new_entities)
+
+
+class HomePilotButtonEventEntity(HomePilotEntity, EventEntity):
+    """This class represents a button of a wall controller."""
+
+    # Only availability changes are published from the coordinator
+    _tracked_fields = ()
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device: HomePilotWallController,
+        poller: WallControllerPoller,
+        channel: int,
+    ) -> None:
+        super().__init__(
+            coordinator,
+            device,
+            unique_id=f"{device.uid}_event_{channel}",
+            name=f"{device.name} Button {channel}",
+            device_class=EventDeviceClass.BUTTON,
+        )
+        self._poller = poller
+        self._channel = channel
+        self._attr_event_types = [EVENT_PRESS]
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._poller.async_add_listener(self.did, self._async_handle_presses))
+
+    @callback
+    def _async_handle_presses(self, presses: list[ChannelPress]) -> None:
+        for press in presses:
+            if press.channel == self._channel:
+                self._trigger_event(EVENT_PRESS, {"latency": press.latency})
+                self.async_write_ha_state()
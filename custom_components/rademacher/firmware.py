@@ -0,0 +1,115 @@
+"""Firmware information of Rademacher Bridge."""
+import asyncio
+from datetime import timedelta
+import logging
+import time
+
+from homepilot.api import AuthError
+from homepilot.hub import HomePilotHub
+from homepilot.manager import HomePilotManager
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .device_states import DeviceStates
+from .refresh import RefreshPlanner
+from .response_cache import async_get_response_cache
+from .scheduler import PRIORITY_BACKGROUND, PRIORITY_REFRESH, BridgeScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+FIRMWARE_UPDATE_INTERVAL = timedelta(hours=1)
+FIRMWARE_PROGRESS_INTERVAL = timedelta(seconds=1)
+# Time (in seconds) after which progress polling gives up on an installation
+FIRMWARE_INSTALL_TIMEOUT = 1800
+
+
+class FirmwareUpdateCoordinator(DataUpdateCoordinator[DeviceStates]):
+    """Polls the firmware information of the hub, separately from the devices.
+
+    Firmware information rarely changes and is polled hourly. While an
+    installation is running, the download progress is polled every second
+    until the hub reports the update as installed.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        manager: HomePilotManager,
+        hub: HomePilotHub,
+        scheduler: BridgeScheduler,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            # Name of the data. For logging purposes.
+            name="rademacher_firmware",
+            update_interval=FIRMWARE_UPDATE_INTERVAL,
+        )
+        self._manager = manager
+        self._hub = hub
+        self._scheduler = scheduler
+        self._device_states = DeviceStates({hub.did: hub})
+        self._install_started: float | None = None
+        self.refresh_planner = RefreshPlanner(hass, self)
+
+    @property
+    def device_states(self) -> DeviceStates:
+        return self._device_states
+
+    @property
+    def installing(self) -> bool:
+        return self._install_started is not None
+
+    async def _async_fetch_firmware(self) -> DeviceStates:
+        # The device refreshes use the cached firmware status
+        self._manager.api.async_expire_fw_status()
+        try:
+            await self._hub.update_state(await self._manager.get_hub_state(), self._manager.api)
+        except BaseException:
+            # The hub device is shared with the device coordinator, the failure
+            # only shows in last_update_success of this coordinator
+            self._device_states.async_invalidate()
+            raise
+        self._device_states.async_patch()
+        return self._device_states
+
+    async def _async_update_data(self) -> DeviceStates:
+        priority = PRIORITY_REFRESH if self.installing else PRIORITY_BACKGROUND
+        try:
+            # Note: asyncio.TimeoutError and aiohttp.ClientError are already
+            # handled by the data update coordinator.
+            async with asyncio.timeout(10):
+                return await self._scheduler.async_fetch(
+                    ("firmware",), priority, self._async_fetch_firmware
+                )
+        except AuthError as err:
+            raise ConfigEntryAuthFailed from err
+        finally:
+            if self.installing:
+                self._async_check_install()
+
+    async def async_track_install(self) -> None:
+        """Poll the progress of the installation just started."""
+        _LOGGER.info("Firmware installation started, polling progress")
+        self._install_started = time.monotonic()
+        self.update_interval = FIRMWARE_PROGRESS_INTERVAL
+        await self.async_refresh()
+
+    @callback
+    def _async_check_install(self) -> None:
+        if not self._hub.fw_update_available:
+            _LOGGER.info("Firmware %s installed", self._hub.fw_version)
+        elif time.monotonic() - self._install_started > FIRMWARE_INSTALL_TIMEOUT:
+            _LOGGER.warning("Firmware installation not completed, stopped polling progress")
+        else:
+            return
+        self._install_started = None
+        self.update_interval = FIRMWARE_UPDATE_INTERVAL
+        # The cached firmware version is outdated after the update
+        async_get_response_cache(self.hass).async_invalidate(self._manager.api.host)
+
+    async def async_shutdown(self) -> None:
+        self.refresh_planner.async_shutdown()
+        await super().async_shutdown()
@@ -0,0 +1,50 @@
+"""In-memory history of sensor readings for Rademacher Bridge."""
+from array import array
+
+
+class SensorHistory:
+    """Fixed size ring buffer of (timestamp, value) samples of one sensor.
+
+    Samples are kept in two preallocated float arrays, so appending a reading
+    never allocates, and the oldest reading is overwritten once full.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._timestamps = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, value: float) -> None:
+        self._timestamps[self._next] = timestamp
+        self._values[self._next] = value
+        self._next = (self._next + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def aggregate(self, now: float, window: float) -> tuple[float, float, float] | None:
+        """Return (min, max, mean) of the samples of the last window seconds."""
+        since = now - window
+        minimum = maximum = total = 0.0
+        count = 0
+        index = self._next
+        # Walk backwards from the newest sample until the window is left
+        for _ in range(self._count):
+            index = (index - 1) % self._capacity
+            if self._timestamps[index] < since:
+                break
+            value = self._values[index]
+            if count == 0:
+                minimum = maximum = value
+            elif value < minimum:
+                minimum = value
+            elif value > maximum:
+                maximum = value
+            total += value
+            count += 1
+        if count == 0:
+            return None
+        return minimum, maximum, total / count
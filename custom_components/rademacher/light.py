@@ -1,5 +1,6 @@
 """Platform for Rademacher Bridge."""
 import asyncio
+from collections.abc import Awaitable
 import logging
 from typing import Any
 
@@ -20,16 +21,18 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
+from .refresh import REFRESH_DELAY_SWITCH
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for light platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -73,17 +76,18 @@ class HomePilotActuatorLightEntity(HomePilotEntity, LightEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         device: HomePilotActuator = self.coordinator.data[self.did]
         if ATTR_BRIGHTNESS in kwargs:
-            await device.async_set_brightness(round(kwargs[ATTR_BRIGHTNESS]*100/255))
+            async with self.command_slot():
+                await device.async_set_brightness(round(kwargs[ATTR_BRIGHTNESS]*100/255))
         else:
-            await device.async_turn_on()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+            async with self.command_slot():
+                await device.async_turn_on()
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         device: HomePilotActuator = self.coordinator.data[self.did]
-        await device.async_turn_off()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_off()
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: not self.is_on)
 
 
 class HomePilotLightEntity(HomePilotEntity, LightEntity):
@@ -138,21 +142,33 @@ class HomePilotLightEntity(HomePilotEntity, LightEntity):
         return device.is_on
 
     async def async_turn_on(self, **kwargs: Any) -> None:
-        device: HomePilotActuator = self.coordinator.data[self.did]
-        if not device.is_on:
-            await device.async_turn_on()
+        device: HomePilotLight = self.coordinator.data[self.did]
+        commands = []
         if ATTR_BRIGHTNESS in kwargs:
-            await device.async_set_brightness(round(kwargs[ATTR_BRIGHTNESS]*100/255))
-        if ATTR_RGB_COLOR in kwargs:
-            await device.async_set_rgb(*kwargs[ATTR_RGB_COLOR])
-        if ATTR_COLOR_TEMP_KELVIN in kwargs:
-            await device.async_set_color_temp(kwargs[ATTR_COLOR_TEMP_KELVIN])
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+            # Setting the brightness turns the light on as well
+            brightness = round(kwargs[ATTR_BRIGHTNESS]*100/255)
+            if not device.is_on or brightness != device.brightness:
+                commands.append(device.async_set_brightness(brightness))
+        elif not device.is_on:
+            commands.append(device.async_turn_on())
+        if ATTR_RGB_COLOR in kwargs and tuple(kwargs[ATTR_RGB_COLOR]) != self.rgb_color:
+            commands.append(device.async_set_rgb(*kwargs[ATTR_RGB_COLOR]))
+        if ATTR_COLOR_TEMP_KELVIN in kwargs and kwargs[ATTR_COLOR_TEMP_KELVIN] != self.color_temp_kelvin:
+            commands.append(device.async_set_color_temp(kwargs[ATTR_COLOR_TEMP_KELVIN]))
+        if not commands:
+            return
+        # Brightness and color are independent settings, send them together,
+        # each request holding its own bridge slot
+        await asyncio.gather(*(self._async_send(command) for command in commands))
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         device: HomePilotActuator = self.coordinator.data[self.did]
-        await device.async_turn_off()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_off()
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: not self.is_on)
+
+    async def _async_send(self, command: Awaitable) -> None:
+        async with self.command_slot():
+            await command
 
@@ -0,0 +1,163 @@
+"""Detection of event loop blocking in the code of Rademacher Bridge."""
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+import functools
+import itertools
+import logging
+import sys
+import threading
+import time
+import traceback
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time (in seconds) a single step may hold the event loop
+LOOP_MONITOR_THRESHOLD = 0.1
+# Blocking steps kept for the diagnostics
+LOOP_MONITOR_REPORTS = 50
+_STACK_LIMIT = 20
+
+
+class LoopMonitor:
+    """Reports steps of the integration holding the event loop too long.
+
+    Instrumented callbacks and coroutines are timed per step, i.e. for a
+    coroutine between two awaits. A watchdog thread captures the stack of
+    the event loop while a step is running longer than the threshold, so
+    the report shows where the loop was blocked, not where the step ended.
+    """
+
+    def __init__(self, threshold: float = LOOP_MONITOR_THRESHOLD) -> None:
+        self._threshold = threshold
+        self._reports: deque[dict[str, Any]] = deque(maxlen=LOOP_MONITOR_REPORTS)
+        self._tokens = itertools.count()
+        # Steps running on the loop, the innermost one last
+        self._active: list[tuple[str, float, int]] = []
+        # Outermost step running, read by the watchdog thread
+        self._current: tuple[int, float] | None = None
+        self._stacks: dict[int, list[str]] = {}
+        self._reported: set[int] = set()
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+
+    @property
+    def reports(self) -> list[dict[str, Any]]:
+        return list(self._reports)
+
+    def start(self) -> None:
+        """Start the watchdog, must be called from the event loop thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._watchdog = threading.Thread(
+            target=self._run_watchdog, name="rademacher_loop_monitor", daemon=True
+        )
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run_watchdog(self) -> None:
+        while not self._stop.wait(self._threshold / 4):
+            current = self._current
+            if current is None:
+                continue
+            token, started = current
+            if token in self._stacks or time.monotonic() - started < self._threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                self._stacks[token] = traceback.format_stack(frame, limit=_STACK_LIMIT)
+
+    def _begin(self, name: str) -> None:
+        token = next(self._tokens)
+        started = time.monotonic()
+        if not self._active:
+            self._current = (token, started)
+        self._active.append((name, started, token))
+
+    def _end(self) -> None:
+        name, started, _ = self._active.pop()
+        duration = time.monotonic() - started
+        outer_token = self._current[0] if self._current is not None else None
+        if duration >= self._threshold and outer_token not in self._reported:
+            # The innermost step exceeding the threshold is the most specific
+            self._reported.add(outer_token)
+            stack = self._stacks.get(outer_token)
+            _LOGGER.warning("%s held the event loop for %.3f s", name, duration)
+            self._reports.append(
+                {
+                    "name": name,
+                    "duration": round(duration, 3),
+                    "at": time.time(),
+                    "stack": stack,
+                }
+            )
+        if not self._active:
+            self._current = None
+            self._stacks.pop(outer_token, None)
+            self._reported.discard(outer_token)
+
+    def wrap_callback(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self._begin(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._end()
+
+        return wrapper
+
+    def instrument_coordinator(self, coordinator) -> None:
+        """Time the update and the listener calls (entity state writes) of a coordinator."""
+        if coordinator.update_method is not None:
+            coordinator.update_method = self.wrap_coroutine_function(
+                f"{coordinator.name} update", coordinator.update_method
+            )
+        else:
+            coordinator._async_update_data = self.wrap_coroutine_function(  # pylint: disable=protected-access
+                f"{coordinator.name} update", coordinator._async_update_data  # pylint: disable=protected-access
+            )
+        coordinator.async_update_listeners = self.wrap_callback(
+            f"{coordinator.name} listeners", coordinator.async_update_listeners
+        )
+
+    def wrap_coroutine_function(
+        self, name: str, func: Callable[..., Coroutine[Any, Any, Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await _MonitoredCoroutine(self, name, func(*args, **kwargs))
+
+        return wrapper
+
+
+class _MonitoredCoroutine:
+    """Drives a coroutine, timing each step it runs on the loop."""
+
+    def __init__(self, monitor: LoopMonitor, name: str, coro: Coroutine[Any, Any, Any]) -> None:
+        self._monitor = monitor
+        self._name = name
+        self._coro = coro
+
+    def __await__(self):
+        value: Any = None
+        error: BaseException | None = None
+        while True:
+            self._monitor._begin(self._name)  # pylint: disable=protected-access
+            try:
+                if error is not None:
+                    yielded = self._coro.throw(error)
+                else:
+                    yielded = self._coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                self._monitor._end()  # pylint: disable=protected-access
+            try:
+                value = yield yielded
+                error = None
+            except BaseException as err:  # pylint: disable=broad-except
+                value = None
+                error = err
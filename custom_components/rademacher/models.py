@@ -0,0 +1,40 @@
+"""Runtime data of a config entry of Rademacher Bridge."""
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from homepilot.manager import HomePilotManager
+
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .aggregates import DeviceAggregates
+from .device_states import DeviceStates
+from .firmware import FirmwareUpdateCoordinator
+from .loop_monitor import LoopMonitor
+from .refresh import RefreshPlanner
+from .scene_executor import SceneExecutor
+from .scene_index import SceneDeviceIndex
+from .scheduler import BridgeScheduler
+from .wall_controller import WallControllerPoller
+
+
+@dataclass
+class RademacherData:
+    """Objects shared by the platforms of a config entry, in hass.data[DOMAIN][entry_id]."""
+
+    manager: HomePilotManager
+    coordinator: DataUpdateCoordinator[DeviceStates]
+    config: Mapping[str, Any]
+    # Options with the defaults of older versions filled in
+    options: dict[str, Any]
+    scene_coordinator: DataUpdateCoordinator
+    refresh_planner: RefreshPlanner
+    scheduler: BridgeScheduler
+    # None without a hub device
+    firmware_coordinator: FirmwareUpdateCoordinator | None
+    wall_controller_poller: WallControllerPoller
+    # None unless enabled in the options
+    loop_monitor: LoopMonitor | None
+    scene_executor: SceneExecutor
+    scene_index: SceneDeviceIndex
+    aggregates: DeviceAggregates
@@ -1,5 +1,4 @@
 """Platform for Rademacher Bridge."""
-import asyncio
 import logging
 
 from homepilot.cover import HomePilotCover
@@ -9,21 +8,25 @@ from homepilot.thermostat import HomePilotThermostat
 
 from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
 from homeassistant.const import CONF_EXCLUDE, PERCENTAGE, UnitOfTemperature
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
+from .refresh import REFRESH_DELAY_CONFIG, REFRESH_DELAY_THERMOSTAT, REFRESH_RETRY_DELAY
+from .write_cache import WriteThroughCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for switch platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -85,9 +88,9 @@ class HomePilotVentilationPositionEntity(HomePilotEntity, NumberEntity):
     async def async_set_native_value(self, value):
         """Turn the entity on."""
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_set_ventilation_position(value)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_ventilation_position(value)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.native_value == value)
 
 class HomePilotTemperatureThresholdEntity(HomePilotEntity, NumberEntity):
     """This class represents Cover Ventilation Position."""
@@ -110,15 +113,43 @@ class HomePilotTemperatureThresholdEntity(HomePilotEntity, NumberEntity):
         self._attr_native_step = device.temperature_thresh_cfg_step[thresh_number-1]
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._thresh_number = thresh_number
+        self._value_cache = WriteThroughCache(
+            self._async_write_value,
+            verify_after=REFRESH_DELAY_THERMOSTAT + REFRESH_RETRY_DELAY,
+            on_failure=self.async_write_ha_state,
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        self._value_cache.async_clear()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        device: HomePilotThermostat = self.coordinator.data[self.did]
+        if self._value_cache.has_value:
+            self._value_cache.async_verify(device.temperature_thresh_cfg_value[self._thresh_number-1])
+            if not self._value_cache.has_value:
+                self._async_publish()
+                return
+        super()._handle_coordinator_update()
 
     @property
     def native_value(self):
+        if self._value_cache.has_value:
+            return self._value_cache.value
         device: HomePilotThermostat = self.coordinator.data[self.did]
         return device.temperature_thresh_cfg_value[self._thresh_number-1]
 
     async def async_set_native_value(self, value):
-        """Turn the entity on."""
+        """Set the threshold, sent once the value stopped changing."""
+        self._value_cache.async_set(self.hass, value)
+        self.async_write_ha_state()
+
+    async def _async_write_value(self, value) -> None:
         device: HomePilotThermostat = self.coordinator.data[self.did]
-        await device.async_set_temperature_thresh_cfg(self._thresh_number, value)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_temperature_thresh_cfg(self._thresh_number, value)
+        self.async_schedule_refresh(
+            REFRESH_DELAY_THERMOSTAT,
+            lambda: device.temperature_thresh_cfg_value[self._thresh_number-1] == value,
+        )
@@ -0,0 +1,206 @@
+"""Profiling of the entity properties of Rademacher Bridge."""
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+import functools
+import logging
+import time
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE_PROPERTIES = "profile_properties"
+ATTR_DURATION = "duration"
+# Default time (in seconds) the properties are profiled
+PROFILER_DEFAULT_DURATION = 60
+# Rows of each ranking in the report
+PROFILER_REPORT_ROWS = 25
+
+DATA_PROPERTY_PROFILER = f"{DOMAIN}_property_profiler"
+
+PROFILE_PROPERTIES_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=PROFILER_DEFAULT_DURATION): vol.All(
+            cv.positive_int, vol.Range(min=1, max=3600)
+        ),
+    }
+)
+
+
+def _is_property(descriptor: Any) -> bool:
+    return isinstance(descriptor, (property, functools.cached_property)) or type(
+        descriptor
+    ).__name__.endswith("cached_property")
+
+
+class _ProfiledProperty:
+    """Descriptor timing the property it replaces."""
+
+    def __init__(self, profiler: "PropertyProfiler", name: str, descriptor: Any) -> None:
+        self._profiler = profiler
+        self._name = name
+        self.descriptor = descriptor
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self.descriptor.__get__(obj, objtype)
+        return self._profiler.call(obj, self._name, self.descriptor.__get__, obj, objtype)
+
+
+class _ProfiledDataProperty(_ProfiledProperty):
+    """Descriptor timing the property it replaces, which also has a setter."""
+
+    def __set__(self, obj, value) -> None:
+        self.descriptor.__set__(obj, value)
+
+    def __delete__(self, obj) -> None:
+        self.descriptor.__delete__(obj)
+
+
+class PropertyProfiler:
+    """Counts and times the property reads of entities while running.
+
+    Home Assistant reads many properties of an entity on every state write.
+    While the profiler runs, the properties of the entity classes are
+    replaced by timing descriptors, so entities pay nothing for it
+    otherwise. The time of a property includes the properties it reads
+    itself, a property reading itself through super() is counted once.
+    """
+
+    def __init__(self) -> None:
+        # (class name, property) -> [calls, seconds]
+        self._properties: dict[tuple[str, str], list] = defaultdict(lambda: [0, 0.0])
+        # entity id -> [calls, seconds]
+        self._entities: dict[str, list] = defaultdict(lambda: [0, 0.0])
+        self._active: set[tuple[int, str]] = set()
+        self._patched: list[tuple[type, str, Any]] = []
+        self._started: float | None = None
+        self._duration = 0.0
+
+    def call(self, obj, name: str, func, *args):
+        key = (id(obj), name)
+        if key in self._active:
+            return func(*args)
+        self._active.add(key)
+        started = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started
+            self._active.discard(key)
+            stats = self._properties[(type(obj).__name__, name)]
+            stats[0] += 1
+            stats[1] += elapsed
+            stats = self._entities[getattr(obj, "entity_id", None) or repr(obj)]
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def start(self, classes: Iterable[type]) -> None:
+        """Replace the properties of the entity classes by timing ones.
+
+        Only the given classes are modified, the properties they inherit are
+        replaced on them, so the shared base classes of Home Assistant and
+        the entities of other integrations are left untouched.
+        """
+        patched: dict[tuple[type, str], Any] = {}
+        for cls in classes:
+            for name in dir(cls):
+                if name.startswith("_") or (cls, name) in patched:
+                    continue
+                descriptor = self._resolve(cls, name, patched)
+                if not _is_property(descriptor):
+                    continue
+                wrapper = _ProfiledDataProperty if hasattr(descriptor, "__set__") else _ProfiledProperty
+                patched[(cls, name)] = vars(cls).get(name)
+                self._patched.append((cls, name, vars(cls).get(name)))
+                setattr(cls, name, wrapper(self, name, descriptor))
+        self._started = time.monotonic()
+
+    @staticmethod
+    def _resolve(cls: type, name: str, patched: dict[tuple[type, str], Any]) -> Any:
+        """Attribute of the class as it was before any replacement."""
+        for base in cls.__mro__:
+            if (base, name) in patched:
+                if patched[(base, name)] is not None:
+                    return patched[(base, name)]
+            elif name in vars(base):
+                return vars(base)[name]
+        return None
+
+    def stop(self) -> None:
+        """Restore the properties replaced by start()."""
+        for cls, name, original in reversed(self._patched):
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        self._patched.clear()
+        if self._started is not None:
+            self._duration = time.monotonic() - self._started
+            self._started = None
+
+    def report(self, rows: int = PROFILER_REPORT_ROWS) -> dict[str, Any]:
+        """Properties and entities ranked by their cumulative time."""
+
+        def ranked(stats: dict, keys: tuple[str, ...]) -> list[dict[str, Any]]:
+            ranking = sorted(stats.items(), key=lambda item: item[1][1], reverse=True)[:rows]
+            return [
+                {
+                    **dict(zip(keys, key if isinstance(key, tuple) else (key,))),
+                    "calls": calls,
+                    "total_ms": round(seconds * 1000, 3),
+                    "mean_us": round(seconds / calls * 1e6, 1),
+                }
+                for key, (calls, seconds) in ranking
+            ]
+
+        return {
+            "duration": round(self._duration, 1),
+            "properties": ranked(self._properties, ("entity_class", "property")),
+            "entities": ranked(self._entities, ("entity_id",)),
+        }
+
+
+def async_register_profiler_service(hass: HomeAssistant) -> None:
+    """Register the service profiling the properties of all entities of the integration."""
+
+    async def async_profile_properties(call: ServiceCall) -> ServiceResponse:
+        if hass.data.get(DATA_PROPERTY_PROFILER) is not None:
+            raise HomeAssistantError("Property profiling is already running")
+        classes = {
+            type(entity)
+            for platform in async_get_platforms(hass, DOMAIN)
+            for entity in platform.entities.values()
+        }
+        profiler = hass.data[DATA_PROPERTY_PROFILER] = PropertyProfiler()
+        _LOGGER.info("Profiling properties of %s entity classes for %s s", len(classes), call.data[ATTR_DURATION])
+        profiler.start(classes)
+        try:
+            await asyncio.sleep(call.data[ATTR_DURATION])
+        finally:
+            profiler.stop()
+            hass.data.pop(DATA_PROPERTY_PROFILER)
+        report = profiler.report()
+        for row in report["properties"]:
+            _LOGGER.info(
+                "%s.%s: %s calls, %s ms total, %s us mean",
+                row["entity_class"], row["property"], row["calls"], row["total_ms"], row["mean_us"],
+            )
+        return report
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE_PROPERTIES,
+        async_profile_properties,
+        schema=PROFILE_PROPERTIES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
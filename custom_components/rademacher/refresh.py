@@ -0,0 +1,71 @@
+"""Post-command refresh scheduling for Rademacher Bridge."""
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Expected time (in seconds) until the bridge reports the result of a command
+REFRESH_DELAY_CONFIG = 2.0
+REFRESH_DELAY_SWITCH = 2.0
+REFRESH_DELAY_COVER_STOP = 2.0
+REFRESH_DELAY_COVER_TILT = 3.0
+REFRESH_DELAY_THERMOSTAT = 5.0
+# Delay of the single retry when the state was not final yet
+REFRESH_RETRY_DELAY = 5.0
+
+
+class RefreshPlanner:
+    """Schedules the refresh following a command at its expected completion.
+
+    Instead of refreshing right after a command, when the device has not
+    applied it yet, the refresh is delayed by the time the command is
+    expected to take. If the refreshed state is not final yet, one more
+    refresh is scheduled.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: DataUpdateCoordinator) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._scheduled: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_schedule(
+        self,
+        key: str,
+        delay: float,
+        is_final: Callable[[], bool] | None = None,
+        retry: bool = True,
+    ) -> None:
+        """Schedule a refresh for key, replacing any refresh already planned for it."""
+        self.async_cancel(key)
+
+        async def _async_refresh(_now) -> None:
+            if is_final is not None and retry:
+                self._scheduled[key] = self._coordinator.async_add_listener(_check_final)
+            else:
+                self._scheduled.pop(key, None)
+            await self._coordinator.async_request_refresh()
+
+        @callback
+        def _check_final() -> None:
+            self.async_cancel(key)
+            if not is_final():
+                _LOGGER.debug("State of %s not final yet, refreshing again", key)
+                self.async_schedule(key, REFRESH_RETRY_DELAY, retry=False)
+
+        self._scheduled[key] = async_call_later(self._hass, delay, _async_refresh)
+
+    @callback
+    def async_cancel(self, key: str) -> None:
+        if (unsub := self._scheduled.pop(key, None)) is not None:
+            unsub()
+
+    @callback
+    def async_shutdown(self) -> None:
+        for unsub in self._scheduled.values():
+            unsub()
+        self._scheduled.clear()
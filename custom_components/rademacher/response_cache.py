@@ -0,0 +1,140 @@
+"""Response cache for static endpoints of Rademacher Bridge."""
+from collections.abc import Awaitable, Callable, Hashable, Iterator
+from contextlib import contextmanager
+import copy
+import logging
+import time
+from typing import Any
+
+from homepilot.api import HomePilotApi
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_RESPONSE_CACHE = f"{DOMAIN}_response_cache"
+
+# Time (in seconds) a cached response is served without asking the bridge
+STATIC_RESPONSE_TTL = 300
+
+
+class ResponseCache:
+    """TTL cache of decoded bridge responses, shared by setup and the flows.
+
+    Values are copied on the way in and out, as the library modifies some of
+    the responses it receives.
+    """
+
+    def __init__(self, ttl: float = STATIC_RESPONSE_TTL) -> None:
+        self._ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            return None
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        self._entries = {
+            cached_key: entry for cached_key, entry in self._entries.items() if entry[0] >= now
+        }
+        self._entries[key] = (now + self._ttl, copy.deepcopy(value))
+
+    @callback
+    def async_invalidate(self, host: str, endpoint: str | None = None) -> None:
+        """Drop the cached responses of a bridge, or of one of its endpoints."""
+        self._entries = {
+            key: entry
+            for key, entry in self._entries.items()
+            if key[0] != host or (endpoint is not None and key[2] != endpoint)
+        }
+
+
+@callback
+def async_get_response_cache(hass: HomeAssistant) -> ResponseCache:
+    return hass.data.setdefault(DATA_RESPONSE_CACHE, ResponseCache())
+
+
+class CachingHomePilotApi(HomePilotApi):
+    """HomePilotApi answering requests to static endpoints from a ResponseCache.
+
+    Hub metadata (network interfaces, node name, firmware version and
+    status) is always served from the cache while fresh, so the device
+    refreshes, which fetch the hub state too, leave the firmware endpoints
+    to the firmware coordinator. Device and scene descriptions are only
+    cached within cached_descriptions(), as the same endpoints are polled for
+    states once the manager is built.
+
+    The library does not expose the response headers, so there is no
+    ETag/Last-Modified revalidation. Hashing responses instead would save
+    nothing: the request is sent and the response decoded before it could
+    be hashed, and comparing it costs about as much as the library using it.
+    Only not asking the bridge saves time, which is what the TTL does.
+    """
+
+    def __init__(self, host, password, api_version=1, cache: ResponseCache | None = None) -> None:
+        super().__init__(host, password, api_version)
+        self._cache = cache if cache is not None else ResponseCache()
+        self._cache_descriptions = False
+
+    @contextmanager
+    def cached_descriptions(self) -> Iterator[None]:
+        """Serve device and scene descriptions from the cache within the block."""
+        self._cache_descriptions = True
+        try:
+            yield
+        finally:
+            self._cache_descriptions = False
+
+    async def _async_cached(
+        self, endpoint: str, async_fetch: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Any:
+        key = (self.host, self.api_version, endpoint, *args)
+        value = self._cache.get(key)
+        if value is not None:
+            _LOGGER.debug("Using cached response of %s %s", endpoint, args)
+            return value
+        value = await async_fetch(*args)
+        if value:
+            self._cache.set(key, value)
+        return value
+
+    async def get_devices(self):
+        if not self._cache_descriptions:
+            return await super().get_devices()
+        return await self._async_cached("devices", super().get_devices)
+
+    async def get_device(self, did: str):
+        if not self._cache_descriptions:
+            return await super().get_device(did)
+        return await self._async_cached("device", super().get_device, did)
+
+    async def async_get_scenes(self):
+        if not self._cache_descriptions:
+            return await super().async_get_scenes()
+        return await self._async_cached("scenes", super().async_get_scenes)
+
+    async def async_get_interfaces(self):
+        return await self._async_cached("interfaces", super().async_get_interfaces)
+
+    async def async_get_nodename(self):
+        return await self._async_cached("nodename", super().async_get_nodename)
+
+    async def async_get_fw_version(self):
+        return await self._async_cached("fw_version", super().async_get_fw_version)
+
+    async def async_get_fw_status(self):
+        return await self._async_cached("fw_status", super().async_get_fw_status)
+
+    @callback
+    def async_expire_fw_status(self) -> None:
+        """Ask the bridge for the firmware status on the next request."""
+        self._cache.async_invalidate(self.host, "fw_status")
@@ -1,5 +1,4 @@
 """Platform for Rademacher Bridge."""
-import asyncio
 import logging
 from typing import Any
 
@@ -7,24 +6,29 @@ from homepilot.manager import HomePilotManager
 from homepilot.scenes import HomePilotScene
 
 from homeassistant.components.scene import Scene
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
 
 from .const import DOMAIN
+from .models import RademacherData
+from .scene_executor import SceneExecutor
+from .scene_index import SceneDeviceIndex
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for scene platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    scene_coordinator: DataUpdateCoordinator = entry[4]  # Scene coordinator is at index 4
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    scene_coordinator: DataUpdateCoordinator = entry.scene_coordinator
+    scene_index: SceneDeviceIndex = entry.scene_index
 
     new_entities = []
     for sid in manager.scenes:
         scene: HomePilotScene = manager.scenes[sid]
         _LOGGER.info("Found Scene for ID: %s", sid)
-        new_entities.append(HomePilotSceneEntity(scene_coordinator, scene))
+        new_entities.append(HomePilotSceneEntity(scene_coordinator, scene, scene_index))
     # If we have any new devices, add them
     if new_entities:
         async_add_entities(new_entities)
@@ -35,17 +39,29 @@ class HomePilotSceneEntity(CoordinatorEntity, Scene):
     """This class represents a Rademacher HomePilot Scene."""
 
     def __init__(
-        self, coordinator: DataUpdateCoordinator, scene: HomePilotScene
+        self, coordinator: DataUpdateCoordinator, scene: HomePilotScene, scene_index: SceneDeviceIndex
     ) -> None:
         # Initialize both parent classes
         CoordinatorEntity.__init__(self, coordinator)
         Scene.__init__(self)
 
         self._sid = scene.sid
+        self._scene_index = scene_index
         # Use hub MAC + scene sid for globally unique ID, similar to device entities
         hub_mac = coordinator.config_entry.unique_id or "unknown"
         self._attr_unique_id = f"{hub_mac}_scene_{scene.sid}"
         self._attr_name = f"Homepilot - {scene.name}"
+        self._extra_attributes = None
+        self._extra_attributes_stale = True
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._scene_index.async_add_listener(self._sid, self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._extra_attributes_stale = True
+        super()._handle_coordinator_update()
 
     @property
     def device_info(self):
@@ -95,13 +111,20 @@ class HomePilotSceneEntity(CoordinatorEntity, Scene):
 
     @property
     def extra_state_attributes(self):
-        scene: HomePilotScene = self.coordinator.data[self._sid]
-        return {
-            "scene_id": self._sid,
-            "is_enabled": scene.is_enabled,
-            "is_manual_executable": scene.is_manual_executable,
-            "description": scene.description,
-        }
+        if self._extra_attributes_stale:
+            scene: HomePilotScene = self.coordinator.data[self._sid]
+            self._extra_attributes = {
+                "scene_id": self._sid,
+                "is_enabled": scene.is_enabled,
+                "is_manual_executable": scene.is_manual_executable,
+                "description": scene.description,
+                # Devices seen to change when the scene ran alone. A device removed
+                # from the scene on the bridge is only dropped after the scene
+                # ran while the device was in another state than the scene sets.
+                "device_ids": sorted(self._scene_index.devices(self._sid)),
+            }
+            self._extra_attributes_stale = False
+        return self._extra_attributes
 
     async def async_activate(self, **kwargs: Any) -> None:
         """Activate scene. Try to get entities into requested state."""
@@ -113,7 +136,6 @@ class HomePilotSceneEntity(CoordinatorEntity, Scene):
             _LOGGER.warning("Scene %s (%s) is not manually executable", scene.name, self._sid)
             return
 
-        await scene.async_execute_scene()
-        # Request coordinator refresh after scene execution (like other entities)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
\ No newline at end of file
+        # The devices of the scene are refreshed once it completes
+        scene_executor: SceneExecutor = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id].scene_executor
+        await scene_executor.async_execute([self._sid])
\ No newline at end of file
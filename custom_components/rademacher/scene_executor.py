@@ -0,0 +1,258 @@
+"""Scene execution with targeted device refreshes for Rademacher Bridge."""
+import asyncio
+from collections.abc import Iterable
+import logging
+
+from homepilot.api import AuthError
+from homepilot.manager import HomePilotManager
+from homepilot.scenes import HomePilotScene
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DOMAIN
+from .device_states import DeviceStates, actuator_fields
+from .scene_index import SceneDeviceIndex
+from .scheduler import PRIORITY_COMMAND, PRIORITY_REFRESH, BridgeScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time (in seconds) between the refreshes following a scene execution
+SCENE_REFRESH_DELAY = 3.0
+# Refreshes after which a scene is considered complete even if devices still change
+SCENE_MAX_REFRESHES = 10
+# Above this number of devices, fetching all device states at once is cheaper
+SCENE_TARGETED_REFRESH_MAX = 5
+
+SERVICE_EXECUTE_SCENES = "execute_scenes"
+
+EXECUTE_SCENES_SCHEMA = vol.Schema({vol.Required(ATTR_ENTITY_ID): cv.entity_ids})
+
+
+class SceneExecutor:
+    """Executes scenes and refreshes the devices they affect until they settle.
+
+    Scenes of a batch are executed concurrently, except scenes controlling
+    the same devices, which are executed in the order given so the result
+    does not depend on the bridge. Afterwards the devices the
+    scenes affect are refreshed every few seconds until a refresh reports
+    no change anymore, i.e. the scenes are complete. Only the affected
+    devices are fetched when they are known and few, otherwise all device
+    states are refreshed at once. Only the state fields of actuators
+    (covers, switches, lights, thermostats) count as changes.
+
+    The bridge does not report which devices a scene controls. They are
+    learned from the devices changing after a scene was executed alone, and
+    recorded in the scene device index. A device already in the state the
+    scene sets does not change either, so a known device is only dropped
+    when the scene completed while the device stayed in another state than
+    the scene left it in on its previous execution (since startup).
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        manager: HomePilotManager,
+        coordinator: DataUpdateCoordinator[DeviceStates],
+        scheduler: BridgeScheduler,
+        scene_index: SceneDeviceIndex,
+    ) -> None:
+        self._hass = hass
+        self._entry = entry
+        self._manager = manager
+        self._coordinator = coordinator
+        self._scheduler = scheduler
+        self._scene_index = scene_index
+        # Scenes only control actuators, sensor readings changing meanwhile are ignored
+        self._actuator_fields = {
+            did: fields
+            for did, device in manager.devices.items()
+            if (fields := actuator_fields(device)) is not None
+        }
+        # States the scenes left their devices in, by scene and device
+        self._scene_targets: dict[str, dict[str, tuple]] = {}
+
+    async def async_execute(self, sids: Iterable[str]) -> None:
+        """Execute the scenes concurrently, their completion is tracked in the background."""
+        scenes: list[HomePilotScene] = [self._manager.scenes[sid] for sid in dict.fromkeys(sids)]
+        results: list[BaseException | None] = [None] * len(scenes)
+        for wave in self._execution_waves([scene.sid for scene in scenes]):
+            wave_results = await asyncio.gather(
+                *(self._async_execute_scene(scenes[index]) for index in wave), return_exceptions=True
+            )
+            for index, result in zip(wave, wave_results):
+                results[index] = result
+        executed = [scene.sid for scene, result in zip(scenes, results) if result is None]
+        if executed:
+            self._entry.async_create_background_task(
+                self._hass,
+                self._async_track_completion(executed),
+                f"rademacher scene completion {' '.join(executed)}",
+            )
+        for scene, result in zip(scenes, results):
+            if isinstance(result, BaseException):
+                raise HomeAssistantError(f"Error executing scene {scene.name}: {result}") from result
+
+    def _execution_waves(self, sids: list[str]) -> list[list[int]]:
+        """Group the scenes (by index) so scenes sharing devices are in later waves."""
+        conflicts = self._scene_index.conflicts(sids)
+        if not conflicts:
+            return [list(range(len(sids)))]
+        _LOGGER.debug("Scenes controlling the same devices executed in order: %s", conflicts)
+        waves: list[list[int]] = []
+        wave_of: dict[str, int] = {}
+        for index, sid in enumerate(sids):
+            wave = 0
+            for did in self._scene_index.devices(sid):
+                for other in conflicts.get(did, ()):
+                    if other in wave_of:
+                        wave = max(wave, wave_of[other] + 1)
+            wave_of[sid] = wave
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append(index)
+        return waves
+
+    async def _async_execute_scene(self, scene: HomePilotScene) -> None:
+        _LOGGER.debug("Executing scene %s", scene.sid)
+        async with self._scheduler.slot(PRIORITY_COMMAND):
+            await scene.async_execute_scene()
+
+    async def _async_track_completion(self, sids: list[str]) -> None:
+        # Devices known before the execution, all of them are refreshed until the scenes settle
+        known = self._affected_devices(sids) or set()
+        changed: set[str] = set()
+        observed: set[str] = set()
+
+        @callback
+        def _collect_changes() -> None:
+            device_states = self._coordinator.data
+            for did in device_states.changed_devices:
+                fields = self._actuator_fields.get(did)
+                if fields is not None and device_states.changed(did, fields):
+                    changed.add(did)
+
+        # Changes are also collected from the regular polls in between
+        unsub = self._coordinator.async_add_listener(_collect_changes)
+        settled = False
+        try:
+            for _ in range(SCENE_MAX_REFRESHES):
+                # Changes reported by the polls during the delay count as well
+                changed.clear()
+                await asyncio.sleep(SCENE_REFRESH_DELAY)
+                affected = self._affected_devices(sids)
+                try:
+                    if affected is not None and len(affected) <= SCENE_TARGETED_REFRESH_MAX:
+                        await self._async_refresh_devices(affected)
+                    else:
+                        await self._coordinator.async_refresh()
+                        if not self._coordinator.last_update_success:
+                            # The coordinator logged the error already
+                            _LOGGER.debug("Refresh after scenes %s failed", sids)
+                            return
+                    # Other devices changing meanwhile don't delay the completion
+                    settled = not changed & affected if affected is not None else not changed
+                except AuthError:
+                    # AuthError derives from BaseException. The device coordinator gets
+                    # the same error on its next refresh and starts the reauthentication.
+                    _LOGGER.debug("Authentication failed while refreshing after scenes %s", sids)
+                    return
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.debug("Error while refreshing after scenes %s: %s", sids, err)
+                    return
+                observed |= changed
+                if settled:
+                    break
+        finally:
+            unsub()
+        _LOGGER.debug("Scenes %s complete, changed devices: %s", sids, observed)
+        if len(sids) == 1 and settled:
+            # Only a scene executed alone tells which devices it controls
+            self._async_learn_devices(sids[0], known, observed)
+
+    @callback
+    def _async_learn_devices(self, sid: str, known: set[str], changed: set[str]) -> None:
+        targets = self._scene_targets.setdefault(sid, {})
+        unchanged = {
+            did
+            for did in known - changed
+            if self._manager.devices[did].available and did in targets
+        }
+        dropped = {did for did in unchanged if targets[did] != self._actuator_state(did)}
+        if dropped:
+            _LOGGER.debug("Devices %s no longer controlled by scene %s", dropped, sid)
+        self._scene_index.async_update_devices(sid, changed, dropped)
+        for did in dropped:
+            del targets[did]
+        for did in self._scene_index.devices(sid):
+            targets[did] = self._actuator_state(did)
+
+    def _actuator_state(self, did: str) -> tuple:
+        device = self._manager.devices[did]
+        return tuple(getattr(device, field, None) for field in self._actuator_fields[did])
+
+    def _affected_devices(self, sids: list[str]) -> set[str] | None:
+        """Devices affected by the scenes, None if unknown for any of them."""
+        affected: set[str] = set()
+        for sid in sids:
+            if sid not in self._scene_index:
+                return None
+            affected |= self._scene_index.devices(sid)
+        return affected
+
+    async def _async_refresh_devices(self, dids: set[str]) -> None:
+        device_states: DeviceStates = self._coordinator.data
+        api = self._manager.api
+
+        async def async_fetch_device_states():
+            for did in dids:
+                device = self._manager.devices[did]
+                state = await api.async_get_device_state(did)
+                if state:
+                    await device.update_state(state, api)
+                else:
+                    device.available = False
+            device_states.async_patch()
+            return device_states
+
+        await self._scheduler.async_fetch(
+            ("device_states", *sorted(dids)), PRIORITY_REFRESH, async_fetch_device_states
+        )
+        # Unlike async_set_updated_data, this keeps the next regular poll of all devices scheduled
+        self._coordinator.async_update_listeners()
+
+
+def async_register_scene_service(hass: HomeAssistant) -> None:
+    """Register the service executing several scenes at once."""
+
+    async def async_execute_scenes(call: ServiceCall) -> None:
+        scene_entities = {
+            entity_id: (platform.config_entry.entry_id, entity)
+            for platform in async_get_platforms(hass, DOMAIN)
+            if platform.domain == "scene"
+            for entity_id, entity in platform.entities.items()
+        }
+        batches: dict[str, list[str]] = {}
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            if entity_id not in scene_entities:
+                raise HomeAssistantError(f"{entity_id} is not a Rademacher scene")
+            entry_id, entity = scene_entities[entity_id]
+            batches.setdefault(entry_id, []).append(entity.sid)
+        # Scenes of different bridges are executed at the same time as well
+        await asyncio.gather(
+            *(
+                hass.data[DOMAIN][entry_id].scene_executor.async_execute(sids)
+                for entry_id, sids in batches.items()
+            )
+        )
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_EXECUTE_SCENES, async_execute_scenes, schema=EXECUTE_SCENES_SCHEMA
+    )
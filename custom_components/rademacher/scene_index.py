@@ -0,0 +1,135 @@
+"""Index of the devices controlled by the scenes of Rademacher Bridge."""
+from collections.abc import Iterable, Mapping
+import logging
+
+from homepilot.device import HomePilotDevice
+from homepilot.scenes import HomePilotScene
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .device_states import actuator_fields
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Time (in seconds) changes are collected before the index is written
+SCENE_INDEX_SAVE_DELAY = 60
+
+
+class SceneDeviceIndex:
+    """Devices controlled by each scene, and scenes controlling each device.
+
+    The bridge does not report the actions of a scene, the devices are
+    learned from scene executions. The index is persisted, so it is
+    complete right after discovery, and both directions are kept up to
+    date on every change so lookups never iterate over scenes or devices.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self._store: Store[dict[str, list[str]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.scene_devices"
+        )
+        self._devices_by_scene: dict[str, frozenset[str]] = {}
+        self._scenes_by_device: dict[str, set[str]] = {}
+        self._listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        # Scenes only control actuators, other devices are never recorded
+        self._actuators: frozenset[str] = frozenset()
+
+    async def async_load(
+        self, scenes: Mapping[str, HomePilotScene], devices: Mapping[str, HomePilotDevice]
+    ) -> None:
+        """Build the index of the discovered scenes and devices."""
+        try:
+            stored = await self._store.async_load() or {}
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while loading the scene device index")
+            stored = {}
+        self._actuators = frozenset(
+            did for did, device in devices.items() if actuator_fields(device) is not None
+        )
+        for sid, dids in stored.items():
+            if sid in scenes:
+                self._set(sid, self._actuators.intersection(dids))
+        _LOGGER.debug("Devices known for %s of %s scenes", len(self._devices_by_scene), len(scenes))
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    def __contains__(self, sid: str) -> bool:
+        return sid in self._devices_by_scene
+
+    def devices(self, sid: str) -> frozenset[str]:
+        """Devices controlled by the scene, empty if not known yet."""
+        return self._devices_by_scene.get(sid, frozenset())
+
+    def scenes(self, did: str) -> frozenset[str]:
+        """Scenes controlling the device."""
+        return frozenset(self._scenes_by_device.get(did, ()))
+
+    def conflicts(self, sids: Iterable[str]) -> dict[str, list[str]]:
+        """Devices controlled by more than one of the scenes, with those scenes."""
+        controlled_by: dict[str, list[str]] = {}
+        for sid in sids:
+            for did in self._devices_by_scene.get(sid, ()):
+                controlled_by.setdefault(did, []).append(sid)
+        return {did: scenes for did, scenes in controlled_by.items() if len(scenes) > 1}
+
+    @property
+    def size(self) -> int:
+        return len(self._devices_by_scene)
+
+    @callback
+    def async_update_devices(self, sid: str, added: Iterable[str], removed: Iterable[str] = ()) -> None:
+        """Record devices seen to be controlled by the scene, and drop the ones seen not to be."""
+        devices = (self.devices(sid) | self._actuators.intersection(added)).difference(removed)
+        if devices == self.devices(sid):
+            return
+        # A scene without known devices is unknown again
+        self._set(sid, devices or None)
+        self._async_changed(sid)
+
+    @callback
+    def async_remove_scene(self, sid: str) -> None:
+        """Forget the scene, e.g. when it was deleted on the bridge."""
+        if sid not in self._devices_by_scene:
+            return
+        self._set(sid, None)
+        self._async_changed(sid)
+
+    @callback
+    def async_add_listener(self, sid: str, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback when the devices of the scene change."""
+        self._listeners.setdefault(sid, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners[sid].remove(update_callback)
+            if not self._listeners[sid]:
+                del self._listeners[sid]
+
+        return remove_listener
+
+    def _set(self, sid: str, dids: frozenset[str] | None) -> None:
+        for did in self._devices_by_scene.get(sid, ()):
+            scenes = self._scenes_by_device[did]
+            scenes.discard(sid)
+            if not scenes:
+                del self._scenes_by_device[did]
+        if dids is None:
+            self._devices_by_scene.pop(sid, None)
+            return
+        self._devices_by_scene[sid] = dids
+        for did in dids:
+            self._scenes_by_device.setdefault(did, set()).add(sid)
+
+    @callback
+    def _async_changed(self, sid: str) -> None:
+        self._store.async_delay_save(self._data_to_save, SCENE_INDEX_SAVE_DELAY)
+        for update_callback in list(self._listeners.get(sid, [])):
+            update_callback()
+
+    def _data_to_save(self) -> dict[str, list[str]]:
+        return {sid: sorted(dids) for sid, dids in self._devices_by_scene.items()}
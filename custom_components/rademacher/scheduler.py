@@ -0,0 +1,192 @@
+"""Prioritized access to the Rademacher Bridge."""
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import asynccontextmanager
+import heapq
+import itertools
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower value is served first
+PRIORITY_COMMAND = 0
+PRIORITY_REFRESH = 1
+PRIORITY_BACKGROUND = 2
+
+# Operations the bridge is asked to handle at the same time
+MAX_IN_FLIGHT = 2
+# Latest operations per priority the latency statistics are computed from
+LATENCY_SAMPLES = 1000
+# Time (in seconds) after which a fetch gives its bridge slot up, the bridge
+# session itself has no timeout
+FETCH_TIMEOUT = 30
+
+_PRIORITY_NAMES = {
+    PRIORITY_COMMAND: "command",
+    PRIORITY_REFRESH: "refresh",
+    PRIORITY_BACKGROUND: "background",
+}
+
+
+class OperationStats:
+    """Counts and latencies of the bridge operations of one priority."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self._latencies: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, latency: float, failed: bool) -> None:
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self._latencies.append(latency)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counts, error rate and latency percentiles (in seconds)."""
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction: float) -> float | None:
+            if not latencies:
+                return None
+            return round(latencies[min(int(fraction * len(latencies)), len(latencies) - 1)], 3)
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.count, 3) if self.count else None,
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "latency_p99": percentile(0.99),
+            "latency_max": round(latencies[-1], 3) if latencies else None,
+        }
+
+
+class BridgeScheduler:
+    """Limits the operations in flight on the bridge and orders the waiting ones.
+
+    When the limit is reached, waiting operations are started by priority:
+    interactive commands first, device refreshes second and background
+    polls (scenes, firmware) last. Operations of the same priority keep
+    their order.
+
+    Read-only fetches are additionally single-flight: while a fetch is in
+    flight, identical fetches wait for its result instead of asking the
+    bridge again. A fetch is cancelled once all its callers are, e.g. by
+    their timeouts, and gives up after FETCH_TIMEOUT in any case.
+    """
+
+    def __init__(self, max_in_flight: int = MAX_IN_FLIGHT) -> None:
+        self._max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._fetches: dict[Hashable, asyncio.Future] = {}
+        # Callers waiting for each fetch in flight
+        self._fetch_callers: dict[asyncio.Future, int] = {}
+        self._stats: dict[int, OperationStats] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def statistics(self) -> dict[str, dict[str, Any]]:
+        """Operation statistics per priority, latencies include the time queued."""
+        return {
+            _PRIORITY_NAMES.get(priority, str(priority)): stats.as_dict()
+            for priority, stats in sorted(self._stats.items())
+        }
+
+    @asynccontextmanager
+    async def slot(self, priority: int):
+        """Hold one of the bridge slots for the duration of the block."""
+        started = time.monotonic()
+        await self._acquire(priority)
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._release()
+            self._stats.setdefault(priority, OperationStats()).record(
+                time.monotonic() - started, failed
+            )
+
+    async def async_fetch(
+        self, key: Hashable, priority: int, async_fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run a read-only fetch, or share the result of the identical one in flight.
+
+        key identifies the endpoint and device fetched, e.g. ("channels", did).
+        """
+        fetch = self._fetches.get(key)
+        if fetch is None:
+            _LOGGER.debug("Fetching %s", key)
+            fetch = asyncio.ensure_future(self._async_run_fetch(priority, async_fetch))
+            self._fetches[key] = fetch
+            fetch.add_done_callback(lambda done: self._fetch_done(key, done))
+        else:
+            _LOGGER.debug("Joining fetch of %s already in flight", key)
+        self._fetch_callers[fetch] = self._fetch_callers.get(fetch, 0) + 1
+        try:
+            # A cancelled caller must not cancel the fetch shared with the others
+            return await asyncio.shield(fetch)
+        finally:
+            self._fetch_callers[fetch] -= 1
+            if not self._fetch_callers[fetch]:
+                del self._fetch_callers[fetch]
+                if not fetch.done():
+                    _LOGGER.debug("Cancelling fetch of %s, no caller waits for it", key)
+                    fetch.cancel()
+                    # Later identical fetches must not join the cancelled one
+                    if self._fetches.get(key) is fetch:
+                        del self._fetches[key]
+
+    async def _async_run_fetch(self, priority: int, async_fetch: Callable[[], Awaitable[Any]]) -> Any:
+        async with self.slot(priority):
+            async with asyncio.timeout(FETCH_TIMEOUT):
+                return await async_fetch()
+
+    def _fetch_done(self, key: Hashable, fetch: asyncio.Future) -> None:
+        if self._fetches.get(key) is fetch:
+            del self._fetches[key]
+        if not fetch.cancelled():
+            # Retrieved here in case every caller was cancelled meanwhile
+            fetch.exception()
+
+    async def _acquire(self, priority: int) -> None:
+        if self._in_flight < self._max_in_flight and not self._waiters:
+            self._in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        _LOGGER.debug("Bridge busy, queued operation with priority %s (%s waiting)", priority, len(self._waiters))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation
+                self._release()
+            else:
+                self._discard(waiter)
+            raise
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        self._waiters = [entry for entry in self._waiters if entry[2] is not waiter]
+        heapq.heapify(self._waiters)
+
+    def _release(self) -> None:
+        # Hand the slot over to the most urgent waiter, in_flight is unchanged
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
@@ -1,8 +1,11 @@
 """Platform for Rademacher Bridge."""
 from enum import Enum
 import logging
+from operator import attrgetter
+import time
 
 from homepilot.device import HomePilotDevice
+from homepilot.hub import HomePilotHub
 from homepilot.manager import HomePilotManager
 from homepilot.sensor import ContactState, HomePilotSensor
 from homepilot.thermostat import HomePilotThermostat
@@ -21,22 +24,39 @@ from homeassistant.const import (
     UnitOfSpeed,
     UnitOfTemperature,
 )
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
-from .entity import HomePilotEntity
+from .aggregates import DeviceAggregates
+from .const import CONF_SENSOR_DEADBAND_SCALE, DEFAULT_SENSOR_DEADBAND_SCALE, DOMAIN
+from .entity import HomePilotAggregateEntity, HomePilotEntity
+from .history import SensorHistory
+from .models import RademacherData
+from .wall_controller import WallControllerPoller
 
 _LOGGER = logging.getLogger(__name__)
 
+# One hour of readings at the default 10 s polling interval
+HISTORY_CAPACITY = 360
+# Window (in seconds) of the statistics published as attributes
+STATISTICS_WINDOW = 300
+# Readings within the deadband are still published after this many seconds
+MAX_SILENT_INTERVAL = 900
+# Differences this close to a deadband count as reaching it
+DEADBAND_TOLERANCE = 1e-9
+
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for sensor platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
-    ternary_contact_sensors: list[str] = entry[3][CONF_SENSOR_TYPE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
+    ternary_contact_sensors: list[str] = entry.options[CONF_SENSOR_TYPE]
+    wall_controller_poller: WallControllerPoller = entry.wall_controller_poller
+    aggregates: DeviceAggregates = entry.aggregates
+    deadband_scale: float = entry.options.get(CONF_SENSOR_DEADBAND_SCALE, DEFAULT_SENSOR_DEADBAND_SCALE)
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -55,6 +75,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             value_attr="temperature_value",
                             device_class=SensorDeviceClass.TEMPERATURE.value,
                             native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+                            value_filter=DeadbandFilter(absolute=0.1, scale=deadband_scale),
                         )
                     )
                 if device.has_target_temperature:
@@ -85,6 +106,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             value_attr="wind_speed_value",
                             native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
                             icon="mdi:weather-windy",
+                            value_filter=DeadbandFilter(absolute=0.5, hysteresis=0.2, scale=deadband_scale),
                         )
                     )
                 if device.has_brightness:
@@ -100,6 +122,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             value_attr="brightness_value",
                             device_class=SensorDeviceClass.ILLUMINANCE.value,
                             native_unit_of_measurement=LIGHT_LUX,
+                            value_filter=DeadbandFilter(absolute=2, relative=0.05, scale=deadband_scale),
                         )
                     )
                 if device.has_sun_height:
@@ -115,6 +138,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             value_attr="sun_height_value",
                             native_unit_of_measurement=DEGREE,
                             icon="mdi:weather-sunset-up",
+                            value_filter=DeadbandFilter(absolute=1, scale=deadband_scale),
                         )
                     )
                 if device.has_sun_direction:
@@ -130,6 +154,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             value_attr="sun_direction_value",
                             native_unit_of_measurement=DEGREE,
                             icon="mdi:sun-compass",
+                            value_filter=DeadbandFilter(absolute=1, hysteresis=1, scale=deadband_scale),
                         )
                     )
                 if device.has_contact_state and device.did in ternary_contact_sensors:
@@ -170,14 +195,113 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                             entity_category=EntityCategory.DIAGNOSTIC,
                         )
                     )
+            if isinstance(device, HomePilotHub) and wall_controller_poller.has_controllers:
+                _LOGGER.info("Found Wall Controller Poll Rate Sensor for Device ID: %s", device.did)
+                new_entities.append(
+                    HomePilotPollRateSensorEntity(coordinator, device, wall_controller_poller)
+                )
+            if isinstance(device, HomePilotHub) and aggregates.covers:
+                _LOGGER.info("Found Open Covers Sensor for Device ID: %s", device.did)
+                new_entities.append(
+                    HomePilotAggregateSensorEntity(
+                        coordinator,
+                        device,
+                        aggregates,
+                        key="open_covers",
+                        name="Open Covers",
+                        value_fn=lambda aggregates: len(aggregates.open_covers),
+                        attributes_fn=lambda aggregates: {"device_ids": sorted(aggregates.open_covers)},
+                        icon="mdi:window-shutter-open",
+                    )
+                )
+            if isinstance(device, HomePilotHub) and aggregates.batteries:
+                _LOGGER.info("Found Lowest Battery Level Sensor for Device ID: %s", device.did)
+                new_entities.append(
+                    HomePilotAggregateSensorEntity(
+                        coordinator,
+                        device,
+                        aggregates,
+                        key="lowest_battery_level",
+                        name="Lowest Battery Level",
+                        value_fn=lambda aggregates: aggregates.lowest_battery,
+                        attributes_fn=lambda aggregates: {
+                            "device_id": lowest[1] if (lowest := aggregates.lowest_battery) else None
+                        },
+                        device_class=SensorDeviceClass.BATTERY,
+                        native_unit_of_measurement=PERCENTAGE,
+                    )
+                )
     # If we have any new devices, add them
     if new_entities:
         async_add_entities(new_entities)
 
 
+class DeadbandFilter:
+    """Decides which readings of a noisy numeric sensor are worth a state write.
+
+    A reading is accepted when it differs from the last accepted one by at
+    least the absolute deadband or the relative deadband (a fraction of the
+    last accepted value), whichever is larger. Reversing the direction of the
+    last accepted change additionally requires the hysteresis on top, so a
+    value oscillating around a threshold doesn't flap. Any reading is accepted
+    once nothing was accepted for max_silent_interval seconds. The deadbands
+    and the hysteresis are multiplied by scale, the factor set in the options.
+    """
+
+    def __init__(
+        self,
+        absolute: float = 0,
+        relative: float = 0,
+        hysteresis: float = 0,
+        max_silent_interval: float = MAX_SILENT_INTERVAL,
+        scale: float = 1,
+    ) -> None:
+        self._absolute = absolute * scale
+        self._relative = relative * scale
+        self._hysteresis = hysteresis * scale
+        self._max_silent_interval = max_silent_interval
+        self._value = None
+        self._accepted_at = 0.0
+        self._direction = 0
+
+    @callback
+    def async_accept(self, value, now: float) -> bool:
+        """Return whether value should be published, and remember it if so."""
+        last = self._value
+        if (
+            not isinstance(value, (int, float))
+            or not isinstance(last, (int, float))
+            or now - self._accepted_at >= self._max_silent_interval
+        ):
+            if value == last and now - self._accepted_at < self._max_silent_interval:
+                return False
+            return self._remember(value, now, 0)
+
+        delta = value - last
+        if delta == 0:
+            return False
+        direction = 1 if delta > 0 else -1
+        threshold = max(self._absolute, self._relative * abs(last))
+        if self._direction and direction != self._direction:
+            threshold += self._hysteresis
+        # Tolerance for binary floats, e.g. 22.7 - 22.6 is slightly below 0.1
+        if abs(delta) < threshold - DEADBAND_TOLERANCE:
+            return False
+        return self._remember(value, now, direction)
+
+    def _remember(self, value, now: float, direction: int) -> bool:
+        self._value = value
+        self._accepted_at = now
+        self._direction = direction
+        return True
+
+
 class HomePilotSensorEntity(HomePilotEntity, SensorEntity):
     """This class represents all Sensors supported."""
 
+    # The statistics change with every reading, the recorder has them as long-term statistics
+    _unrecorded_attributes = frozenset({"min_5min", "max_5min", "mean_5min"})
+
     def __init__(
         self,
         coordinator,
@@ -191,7 +315,8 @@ class HomePilotSensorEntity(HomePilotEntity, SensorEntity):
         icon_template=None,
         entity_category=None,
         options=None,
-        state_class=SensorStateClass.MEASUREMENT
+        state_class=SensorStateClass.MEASUREMENT,
+        value_filter=None,
     ) -> None:
         super().__init__(
             coordinator,
@@ -203,10 +328,49 @@ class HomePilotSensorEntity(HomePilotEntity, SensorEntity):
             entity_category=entity_category,
         )
         self._value_attr = value_attr
+        self._tracked_fields = (value_attr,)
+        self._get_value = attrgetter(value_attr)
         self._icon_template = icon_template
         self._attr_native_unit_of_measurement = native_unit_of_measurement
         self._attr_options = options
         self._attr_state_class = state_class
+        self._value_filter = value_filter
+        self._history = SensorHistory(HISTORY_CAPACITY) if value_filter is not None else None
+        self._published_available = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self._value_filter is None:
+            super()._handle_coordinator_update()
+            return
+        self._memo.clear()
+        device: HomePilotDevice = self.coordinator.data[self.did]
+        value = self._raw_value
+        now = time.monotonic()
+        if isinstance(value, (int, float)):
+            self._history.append(now, value)
+        if device.available == self._published_available and not self._value_filter.async_accept(value, now):
+            return
+        self._published_available = device.available
+        self._async_publish()
+
+    @property
+    def extra_state_attributes(self):
+        return self._memoized("sensor_attributes", self._compute_extra_state_attributes)
+
+    def _compute_extra_state_attributes(self):
+        attributes = super().extra_state_attributes
+        if self._history is None:
+            return attributes
+        statistics = self._history.aggregate(time.monotonic(), STATISTICS_WINDOW)
+        if statistics is None:
+            return attributes
+        return {
+            **(attributes or {}),
+            "min_5min": statistics[0],
+            "max_5min": statistics[1],
+            "mean_5min": round(statistics[2], 2),
+        }
 
     @property
     def value_attr(self):
@@ -215,15 +379,79 @@ class HomePilotSensorEntity(HomePilotEntity, SensorEntity):
         """
         return self._value_attr
 
+    @property
+    def _raw_value(self):
+        return self._memoized(
+            "raw_value", lambda: self._get_value(self.coordinator.data[self.did])
+        )
+
     @property
     def native_value(self):
-        value = getattr(self.coordinator.data[self.did], self.value_attr)
+        return self._memoized("native_value", self._compute_native_value)
+
+    def _compute_native_value(self):
+        value = self._raw_value
         return value.name.capitalize() if isinstance(value, Enum) else value
 
     @property
     def icon(self):
         if self._icon_template is not None:
-            return self._icon_template(
-                getattr(self.coordinator.data[self.did], self.value_attr)
-            )
+            return self._memoized("icon", lambda: self._icon_template(self._raw_value))
         return super().icon
+
+
+class HomePilotPollRateSensorEntity(HomePilotEntity, SensorEntity):
+    """This class represents the current poll rate of the wall controllers."""
+
+    # Only availability changes are published from the coordinator
+    _tracked_fields = ()
+
+    def __init__(
+        self,
+        coordinator: DataUpdateCoordinator,
+        device: HomePilotHub,
+        poller: WallControllerPoller,
+    ) -> None:
+        super().__init__(
+            coordinator,
+            device,
+            unique_id=f"{device.uid}_wall_controller_poll_rate",
+            name=f"{device.name} Wall Controller Poll Rate",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            icon="mdi:timer-sync-outline",
+        )
+        self._poller = poller
+        self._attr_native_unit_of_measurement = "polls/min"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self.async_on_remove(self._poller.async_add_rate_listener(self.async_write_ha_state))
+
+    @property
+    def native_value(self):
+        return self._poller.poll_rate
+
+    @property
+    def extra_state_attributes(self):
+        latency = self._poller.latency_stats
+        return {
+            "presses": latency["count"],
+            "press_latency_mean": latency["mean"],
+            "press_latency_max": latency["max"],
+        }
+
+
+class HomePilotAggregateSensorEntity(HomePilotAggregateEntity, SensorEntity):
+    """This class represents a count or extreme over the devices of the bridge."""
+
+    def __init__(self, *args, native_unit_of_measurement=None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._attr_native_unit_of_measurement = native_unit_of_measurement
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        value = self.aggregate_value
+        # Extremes are published with the device reporting them as attribute
+        return value[0] if isinstance(value, tuple) else value
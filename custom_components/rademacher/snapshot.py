@@ -0,0 +1,137 @@
+"""Persisted device states of Rademacher Bridge, restored on startup."""
+from collections.abc import Mapping
+from enum import Enum
+from importlib.metadata import PackageNotFoundError, version
+import logging
+from typing import Any
+
+from homepilot.device import HomePilotDevice
+from homepilot.sensor import ContactState
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+# Time (in seconds) refreshes are collected before the snapshot is written
+SNAPSHOT_SAVE_DELAY = 60
+
+_ENUMS: dict[str, type[Enum]] = {cls.__name__: cls for cls in (ContactState,)}
+_ENUM_KEY = "__enum__"
+_PLAIN_TYPES = (bool, int, float, str, type(None))
+
+
+def _library_version() -> str | None:
+    try:
+        return version("pyrademacher")
+    except PackageNotFoundError:
+        return None
+
+
+# Read once on import, looking it up reads files
+_LIBRARY_VERSION = _library_version()
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        if type(value).__name__ not in _ENUMS:
+            raise TypeError(type(value).__name__)
+        return {_ENUM_KEY: type(value).__name__, "name": value.name}
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(item, _PLAIN_TYPES) for item in value):
+        return list(value)
+    if isinstance(value, dict) and all(
+        isinstance(key, str) and isinstance(item, _PLAIN_TYPES) for key, item in value.items()
+    ):
+        return value
+    raise TypeError(type(value).__name__)
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict) and _ENUM_KEY in value:
+        return _ENUMS[value[_ENUM_KEY]][value["name"]]
+    return value
+
+
+class DeviceSnapshot:
+    """Last known state of every device, persisted across restarts.
+
+    The manager builds the devices from their descriptions only, their state
+    fields are set by the first refresh. Restoring them from the snapshot
+    lets the entities be added before that refresh has completed.
+
+    The fields are the private attributes the library sets on refresh, so a
+    snapshot is only restored with the library version that saved it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.snapshot"
+        )
+        self._devices: Mapping[str, HomePilotDevice] = {}
+
+    async def async_restore(self, devices: Mapping[str, HomePilotDevice]) -> bool:
+        """Restore the state fields of the devices, return whether all were restored."""
+        self._devices = devices
+        try:
+            snapshot = await self._store.async_load() or {}
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while loading the device snapshot")
+            return False
+        if _LIBRARY_VERSION is None or snapshot.get("library_version") != _LIBRARY_VERSION:
+            _LOGGER.debug(
+                "Device snapshot of pyrademacher %s, not %s, waiting for the first refresh",
+                snapshot.get("library_version"),
+                _LIBRARY_VERSION,
+            )
+            return False
+        snapshot = snapshot["devices"]
+        missing = [did for did in devices if did not in snapshot]
+        if missing:
+            _LOGGER.debug("No snapshot of devices %s, waiting for the first refresh", missing)
+            return False
+        try:
+            for did, device in devices.items():
+                fields = vars(device)
+                if unsaved := [field for field in snapshot[did]["unsaved"] if field not in fields]:
+                    _LOGGER.debug("Fields %s of device %s not in snapshot, waiting for the first refresh", unsaved, did)
+                    return False
+                for field, value in snapshot[did]["fields"].items():
+                    # Fields set from the description are kept: they may come from the
+                    # response cache and be older than the snapshot, but describe the
+                    # device the entities are built for, the first refresh updates both
+                    if field not in fields:
+                        setattr(device, field, _decode(value))
+        except (KeyError, TypeError) as err:
+            _LOGGER.warning("Device snapshot outdated (%s), waiting for the first refresh", err)
+            return False
+        _LOGGER.debug("Restored states of %s devices", len(devices))
+        return True
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, Any]:
+        data = {}
+        for did, device in self._devices.items():
+            fields = {}
+            # Fine if set from the description, otherwise not restorable
+            unsaved = []
+            for field, value in vars(device).items():
+                if field == "_api":
+                    continue
+                try:
+                    fields[field] = _encode(value)
+                except TypeError:
+                    unsaved.append(field)
+            data[did] = {"fields": fields, "unsaved": unsaved}
+        return {"library_version": _LIBRARY_VERSION, "devices": data}
@@ -1,5 +1,6 @@
 """Platform for Rademacher Bridge."""
 import asyncio
+from collections.abc import Callable
 import logging
 
 from homepilot.cover import HomePilotCover
@@ -11,21 +12,25 @@ from homepilot.switch import HomePilotSwitch
 from homepilot.scenes import HomePilotScene
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
 from homeassistant.const import CONF_EXCLUDE
+from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, CoordinatorEntity
 
 from .const import CONF_CREATE_SCENE_ACTIVATION_ENTITIES, DOMAIN
 from .entity import HomePilotEntity
+from .models import RademacherData
+from .refresh import REFRESH_DELAY_CONFIG, REFRESH_DELAY_SWITCH
+from .scheduler import PRIORITY_COMMAND
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for switch platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    coordinator: DataUpdateCoordinator = entry.coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -33,7 +38,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
             if isinstance(device, HomePilotHub):
                 _LOGGER.info("Found Led Switch for Device ID: %s", device.did)
                 new_entities.append(HomePilotLedSwitchEntity(coordinator, device))
-                new_entities.append(HomePilotAutoUpdaeSwitchEntity(coordinator, device))
+                new_entities.append(HomePilotAutoUpdaeSwitchEntity(entry.firmware_coordinator, device))
             if isinstance(device, HomePilotSwitch):
                 _LOGGER.info("Found Switch for Device ID: %s", device.did)
                 new_entities.append(HomePilotSwitchEntity(coordinator, device))
@@ -68,12 +73,12 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 if auto_device.has_sun_auto_mode:
                     _LOGGER.info("Found Sun Auto Mode Config Switch for Device ID: %s", device.did)
                     new_entities.append(HomePilotSunAutoModeEntity(coordinator, device))
-    create_scene_activation_entities = entry[3].get(CONF_CREATE_SCENE_ACTIVATION_ENTITIES, False)
+    create_scene_activation_entities = entry.options.get(CONF_CREATE_SCENE_ACTIVATION_ENTITIES, False)
     if create_scene_activation_entities:
         for sid in manager.scenes:
             scene: HomePilotScene = manager.scenes[sid]
             _LOGGER.info("Found Scene Switch for Scene ID: %s", sid)
-            new_entities.append(HomePilotRademacherSceneEnabledEntity(entry[4], scene))
+            new_entities.append(HomePilotRademacherSceneEnabledEntity(entry.scene_coordinator, scene))
     if new_entities:
         async_add_entities(new_entities)
 
@@ -99,16 +104,16 @@ class HomePilotSwitchEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotSwitch = self.coordinator.data[self.did]
-        await device.async_turn_on()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_on()
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotSwitch = self.coordinator.data[self.did]
-        await device.async_turn_off()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_off()
+        self.async_schedule_refresh(REFRESH_DELAY_SWITCH, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -141,16 +146,16 @@ class HomePilotLedSwitchEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotHub = self.coordinator.data[self.did]
-        await device.async_turn_led_on()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_led_on()
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotHub = self.coordinator.data[self.did]
-        await device.async_turn_led_off()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_turn_led_off()
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -179,19 +184,24 @@ class HomePilotAutoUpdaeSwitchEntity(HomePilotEntity, SwitchEntity):
         device: HomePilotHub = self.coordinator.data[self.did]
         return device.auto_update
 
+    @callback
+    def async_schedule_refresh(self, delay: float, is_final: Callable[[], bool] | None = None):
+        # Auto update is part of the firmware information
+        self.coordinator.refresh_planner.async_schedule(self.unique_id, delay, is_final)
+
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotHub = self.coordinator.data[self.did]
-        await device.async_set_auto_update_on()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_auto_update_on()
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotHub = self.coordinator.data[self.did]
-        await device.async_set_auto_update_off()
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_auto_update_off()
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -223,16 +233,16 @@ class HomePilotVentilationSwitchEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_set_ventilation_position_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_ventilation_position_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotCover = self.coordinator.data[self.did]
-        await device.async_set_ventilation_position_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_ventilation_position_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -264,16 +274,16 @@ class HomePilotAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -306,16 +316,16 @@ class HomePilotTimeAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_time_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_time_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_time_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_time_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -348,16 +358,16 @@ class HomePilotContactAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_contact_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_contact_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_contact_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_contact_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -390,16 +400,16 @@ class HomePilotWindAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_wind_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_wind_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_wind_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_wind_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -432,16 +442,16 @@ class HomePilotDawnAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_dawn_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_dawn_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_dawn_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_dawn_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -474,16 +484,16 @@ class HomePilotDuskAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_dusk_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_dusk_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_dusk_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_dusk_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -516,16 +526,16 @@ class HomePilotRainAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_rain_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_rain_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_rain_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_rain_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -558,16 +568,16 @@ class HomePilotSunAutoModeEntity(HomePilotEntity, SwitchEntity):
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_sun_auto_mode(True)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_sun_auto_mode(True)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: self.is_on)
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         device: HomePilotAutoConfigDevice = self.coordinator.data[self.did]
-        await device.async_set_sun_auto_mode(False)
-        async with asyncio.timeout(5):
-            await self.coordinator.async_request_refresh()
+        async with self.command_slot():
+            await device.async_set_sun_auto_mode(False)
+        self.async_schedule_refresh(REFRESH_DELAY_CONFIG, lambda: not self.is_on)
 
     async def async_toggle(self, **kwargs):
         """Toggle the entity."""
@@ -637,17 +647,23 @@ class HomePilotRademacherSceneEnabledEntity(CoordinatorEntity, SwitchEntity):
             "model": "HomePilot Bridge",
         }
 
+    def command_slot(self):
+        scheduler = self.hass.data[DOMAIN][self.coordinator.config_entry.entry_id].scheduler
+        return scheduler.slot(PRIORITY_COMMAND)
+
     async def async_turn_on(self, **kwargs):
         """Turn the entity on."""
         scene: HomePilotScene = self.coordinator.data[self.sid]
-        await scene.async_activate_scene()
+        async with self.command_slot():
+            await scene.async_activate_scene()
         async with asyncio.timeout(5):
             await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Turn the entity off."""
         scene: HomePilotScene = self.coordinator.data[self.sid]
-        await scene.async_deactivate_scene()
+        async with self.command_slot():
+            await scene.async_deactivate_scene()
         async with asyncio.timeout(5):
             await self.coordinator.async_request_refresh()
 
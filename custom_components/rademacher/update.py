@@ -12,20 +12,21 @@ from homeassistant.components.update import (
     UpdateEntityFeature,
 )
 from homeassistant.const import CONF_EXCLUDE
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 from .entity import HomePilotEntity
+from .firmware import FirmwareUpdateCoordinator
+from .models import RademacherData
 
 _LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(hass, config_entry, async_add_entities):
     """Setup of entities for switch platform."""
-    entry = hass.data[DOMAIN][config_entry.entry_id]
-    manager: HomePilotManager = entry[0]
-    coordinator: DataUpdateCoordinator = entry[1]
-    exclude_devices: list[str] = entry[3][CONF_EXCLUDE]
+    entry: RademacherData = hass.data[DOMAIN][config_entry.entry_id]
+    manager: HomePilotManager = entry.manager
+    firmware_coordinator: FirmwareUpdateCoordinator = entry.firmware_coordinator
+    exclude_devices: list[str] = entry.options[CONF_EXCLUDE]
     new_entities = []
     for did in manager.devices:
         if did not in exclude_devices:
@@ -34,7 +35,7 @@ async def async_setup_entry(hass, config_entry, async_add_entities):
                 _LOGGER.info("Found FW Update Sensor for Device ID: %s", device.did)
                 new_entities.append(
                     HomePilotUpdateEntity(
-                        coordinator=coordinator,
+                        coordinator=firmware_coordinator,
                         device=device,
                         id_suffix="fw_update",
                         name_suffix="Firmware Update",
@@ -52,7 +53,7 @@ class HomePilotUpdateEntity(HomePilotEntity, UpdateEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: FirmwareUpdateCoordinator,
         device: HomePilotDevice,
         id_suffix,
         name_suffix,
@@ -68,6 +69,11 @@ class HomePilotUpdateEntity(HomePilotEntity, UpdateEntity):
         )
         self._attr_supported_features = supported_features
 
+    @property
+    def available(self):
+        # Failed firmware checks don't make the hub unavailable for other entities
+        return self.coordinator.last_update_success and super().available
+
     @property
     def in_progress(self):
         return self.coordinator.data[self.did].download_progress
@@ -96,4 +102,6 @@ class HomePilotUpdateEntity(HomePilotEntity, UpdateEntity):
         """Install update."""
         device: HomePilotHub = self.coordinator.data[self.did]
         _LOGGER.info("Install update v:%s b:%s", version, backup)
-        await device.async_update_firmware()
+        async with self.command_slot():
+            await device.async_update_firmware()
+        await self.coordinator.async_track_install()
@@ -0,0 +1,207 @@
+"""Button press detection for wall controllers of Rademacher Bridge."""
+import asyncio
+from collections.abc import Callable
+from datetime import time as dt_time
+import logging
+import time
+from typing import NamedTuple
+
+from homepilot.api import AuthError
+from homepilot.wallcontroller import HomePilotWallController
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .scheduler import PRIORITY_REFRESH, BridgeScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Poll intervals (in seconds) of the channels
+WALL_CONTROLLER_ACTIVE_INTERVAL = 1.0
+WALL_CONTROLLER_POLL_INTERVAL = 2.0
+WALL_CONTROLLER_IDLE_INTERVAL = 5.0
+WALL_CONTROLLER_QUIET_INTERVAL = 10.0
+# Time (in seconds) after a press polled at the active interval, to catch
+# double and long presses
+WALL_CONTROLLER_ACTIVE_PERIOD = 30
+# Time (in seconds) without presses after which the idle interval is used
+WALL_CONTROLLER_IDLE_AFTER = 600
+
+
+class ChannelPress(NamedTuple):
+    channel: int
+    timestamp: float
+    # Time (in seconds) since the previous poll of the controller, the most the
+    # press can have waited to be detected, None on the first poll
+    latency: float | None
+
+
+class WallControllerPoller:
+    """Polls the channels of all wall controllers and reports button presses.
+
+    The bridge records the timestamp of the last press of every channel. A
+    press is detected when that timestamp changed since the previous poll,
+    so a short press between two polls is not missed, and each timestamp is
+    reported once only. Polling runs while listeners are registered.
+
+    The poll interval adapts to the activity: it is shortened after a press,
+    lengthened after a while without presses and during the quiet hours.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        scheduler: BridgeScheduler,
+        controllers: dict[str, HomePilotWallController],
+        quiet_hours: tuple[dt_time, dt_time] | None = None,
+    ) -> None:
+        self._hass = hass
+        self._scheduler = scheduler
+        self._controllers = controllers
+        self._quiet_hours = quiet_hours
+        self._timestamps = {did: dict(device.channels or {}) for did, device in controllers.items()}
+        # When each controller was last polled successfully, in Home Assistant's monotonic time
+        self._polled_at: dict[str, float] = {}
+        self._listeners: dict[str, list[Callable[[list[ChannelPress]], None]]] = {}
+        self._rate_listeners: list[CALLBACK_TYPE] = []
+        self._unsub_poll: CALLBACK_TYPE | None = None
+        self._interval: float | None = None
+        self._polling_since = 0.0
+        self._last_press: float | None = None
+        self._latency_count = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    @property
+    def latency_stats(self) -> dict[str, float | int | None]:
+        """Detection latency (in seconds) of the presses detected so far.
+
+        The timestamps of the bridge come from a clock not synchronized with
+        Home Assistant, so the latency of a press is bounded by the time
+        between the poll detecting it and the previous one instead.
+        """
+        return {
+            "count": self._latency_count,
+            "mean": self._latency_total / self._latency_count if self._latency_count else None,
+            "max": self._latency_max if self._latency_count else None,
+        }
+
+    @property
+    def has_controllers(self) -> bool:
+        return bool(self._controllers)
+
+    @property
+    def poll_rate(self) -> float:
+        """Current number of channel polls per minute."""
+        if self._interval is None:
+            return 0.0
+        return round(60 / self._interval, 1)
+
+    @callback
+    def async_add_rate_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call update_callback when the poll rate changes."""
+        self._rate_listeners.append(update_callback)
+        return lambda: self._rate_listeners.remove(update_callback)
+
+    @callback
+    def async_add_listener(
+        self, did: str, update_callback: Callable[[list[ChannelPress]], None]
+    ) -> CALLBACK_TYPE:
+        """Call update_callback with the presses detected by every poll of the controller."""
+        self._listeners.setdefault(did, []).append(update_callback)
+        if self._interval is None:
+            self._polling_since = time.monotonic()
+            self._async_schedule_poll()
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners[did].remove(update_callback)
+            if not self._listeners[did]:
+                del self._listeners[did]
+            if not self._listeners:
+                self.async_shutdown()
+
+        return remove_listener
+
+    @callback
+    def async_shutdown(self) -> None:
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        self._async_set_interval(None)
+
+    @callback
+    def _async_set_interval(self, interval: float | None) -> None:
+        if interval == self._interval:
+            return
+        _LOGGER.debug("Polling wall controller channels every %s s", interval)
+        self._interval = interval
+        for update_callback in list(self._rate_listeners):
+            update_callback()
+
+    def _in_quiet_hours(self) -> bool:
+        if self._quiet_hours is None:
+            return False
+        start, end = self._quiet_hours
+        current = dt_util.now().time()
+        if start <= end:
+            return start <= current < end
+        # Quiet hours spanning midnight
+        return current >= start or current < end
+
+    @callback
+    def _async_schedule_poll(self) -> None:
+        now = time.monotonic()
+        if self._last_press is not None and now - self._last_press < WALL_CONTROLLER_ACTIVE_PERIOD:
+            interval = WALL_CONTROLLER_ACTIVE_INTERVAL
+        elif self._in_quiet_hours():
+            interval = WALL_CONTROLLER_QUIET_INTERVAL
+        elif now - max(self._last_press or 0.0, self._polling_since) >= WALL_CONTROLLER_IDLE_AFTER:
+            interval = WALL_CONTROLLER_IDLE_INTERVAL
+        else:
+            interval = WALL_CONTROLLER_POLL_INTERVAL
+        self._async_set_interval(interval)
+        self._unsub_poll = async_call_later(self._hass, interval, self._async_poll)
+
+    async def _async_poll(self, _now=None) -> None:
+        self._unsub_poll = None
+        try:
+            await asyncio.gather(*(self._async_poll_controller(did) for did in list(self._listeners)))
+        finally:
+            # The next poll is planned once this one is complete, so polls never overlap
+            if self._listeners and self._unsub_poll is None:
+                self._async_schedule_poll()
+
+    async def _async_poll_controller(self, did: str) -> None:
+        device = self._controllers[did]
+        try:
+            await self._scheduler.async_fetch(("channels", did), PRIORITY_REFRESH, device.update_channels)
+        except AuthError:
+            # AuthError derives from BaseException. The device coordinator gets
+            # the same error on its next refresh and starts the reauthentication.
+            _LOGGER.debug("Authentication failed while polling channels of wall controller %s", did)
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Error while polling channels of wall controller %s: %s", did, err)
+            return
+        now = time.monotonic()
+        previous_poll = self._polled_at.get(did)
+        self._polled_at[did] = now
+        latency = round(now - previous_poll, 3) if previous_poll is not None else None
+        last_timestamps = self._timestamps[did]
+        presses = []
+        for channel, timestamp in (device.channels or {}).items():
+            if timestamp is None or timestamp == last_timestamps.get(channel):
+                continue
+            last_timestamps[channel] = timestamp
+            press = ChannelPress(channel, timestamp, latency)
+            _LOGGER.debug("Button %s of wall controller %s pressed (latency %s s)", channel, did, press.latency)
+            self._last_press = now
+            if press.latency is not None:
+                self._latency_count += 1
+                self._latency_total += press.latency
+                self._latency_max = max(self._latency_max, press.latency)
+            presses.append(press)
+        for update_callback in list(self._listeners.get(did, [])):
+            update_callback(presses)
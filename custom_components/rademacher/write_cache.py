@@ -0,0 +1,101 @@
+"""Debounced write-through cache for device settings of Rademacher Bridge."""
+from collections.abc import Awaitable, Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time (in seconds) to wait for further changes before sending a value
+WRITE_DEBOUNCE_DELAY = 1.5
+
+
+class WriteThroughCache:
+    """Write-through cache of a single device setting.
+
+    A new value is reflected immediately but only sent to the device once it
+    was not changed again for the debounce delay, so only the final value of
+    a series of changes is written. The cached value is kept until a refresh
+    reports it, or until the refresh following verify_after seconds after the
+    write, whichever comes first.
+
+    The write happens after the service call has returned, so a failed write
+    is only logged, and reported through on_failure with the device value
+    shown again.
+    """
+
+    def __init__(
+        self,
+        async_write: Callable[[Any], Awaitable[None]],
+        verify_after: float,
+        on_failure: Callable[[], None] | None = None,
+        delay: float = WRITE_DEBOUNCE_DELAY,
+    ) -> None:
+        self._async_write = async_write
+        self._verify_after = verify_after
+        self._on_failure = on_failure
+        self._delay = delay
+        self._value: Any = None
+        self._written_at: float | None = None
+        self._unsub_write: CALLBACK_TYPE | None = None
+        # Set while the value is being sent to the device
+        self._writing = False
+
+    @property
+    def has_value(self) -> bool:
+        return self._unsub_write is not None or self._writing or self._written_at is not None
+
+    @property
+    def value(self) -> Any:
+        return self._value
+
+    @callback
+    def async_set(self, hass: HomeAssistant, value: Any) -> None:
+        """Cache value and (re)start the debounce delay."""
+        self._value = value
+        self._written_at = None
+        if self._unsub_write is not None:
+            self._unsub_write()
+        self._unsub_write = async_call_later(hass, self._delay, self._async_flush)
+
+    async def _async_flush(self, _now) -> None:
+        self._unsub_write = None
+        value = self._value
+        self._writing = True
+        try:
+            await self._async_write(value)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error while writing value %s", value)
+            self._writing = False
+            if self._unsub_write is None:
+                # No newer value waiting to be written
+                self.async_clear()
+                if self._on_failure is not None:
+                    self._on_failure()
+            return
+        finally:
+            self._writing = False
+        if self._unsub_write is None and self._value == value:
+            self._written_at = time.monotonic()
+
+    @callback
+    def async_verify(self, current: Any) -> None:
+        """Drop the cached value once the device reports it or verification is due."""
+        if self._written_at is None:
+            # Not written yet
+            return
+        if current != self._value:
+            if time.monotonic() - self._written_at < self._verify_after:
+                return
+            _LOGGER.debug("Written value %s not confirmed by device (reports %s)", self._value, current)
+        self._written_at = None
+
+    @callback
+    def async_clear(self) -> None:
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
+        self._written_at = None
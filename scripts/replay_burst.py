@@ -0,0 +1,327 @@
+"""Replay a burst of commands through the integration against a simulated Rademacher Bridge.
+
+The integration is set up from a config entry in a test instance of Home
+Assistant (pytest-homeassistant-custom-component, see requirements_test.txt).
+The library talks to a simulated bridge instead of the network: every
+request is answered after a random delay, some of them with an error, and
+commands change the device states the next refresh reports.
+
+The commands are the services of the entities, so they take the same path
+as in Home Assistant: covers opened or closed, lights changing brightness
+and color (two requests), switches turned on or off and scenes activated.
+The refreshes the entities plan run as well, and the burst is followed by
+a pause for them. Without a trace, the burst is 50 cover commands, 20 light
+changes, 10 switch commands and 5 scene activations within one second. A
+trace is a JSON list of commands like {"at": 0.12, "kind": "light"}, "at"
+in seconds from the start, "kind" one of cover, light, switch or scene.
+
+    python scripts/replay_burst.py [--trace trace.json] [--latency 0.08] [--error-rate 0.02]
+"""
+import argparse
+import asyncio
+from collections import Counter
+import json
+import logging
+from pathlib import Path
+import random
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+import aiohttp
+from homepilot.api import HomePilotApi
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_test_home_assistant
+
+from homeassistant import loader
+from homeassistant.const import CONF_API_VERSION, CONF_HOST, CONF_PASSWORD
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+from custom_components.rademacher.const import DOMAIN  # noqa: E402
+
+KINDS = ("cover", "light", "switch", "scene")
+MAC_ADDRESS = "b0:1f:81:00:00:01"
+# Device types of the bridge
+COVER_TYPE = "2"
+SWITCH_TYPE = "1"
+LIGHT_TYPE = "70"
+
+
+def _description(did: str, device_type: str, *capabilities: str) -> dict:
+    return {
+        "capabilities": [
+            {"name": "ID_DEVICE_LOC", "value": did},
+            {"name": "PROT_ID_DEVICE_LOC", "value": f"sim_{did}"},
+            {"name": "NAME_DEVICE_LOC", "value": f"Device {did}"},
+            {"name": "PROD_CODE_DEVICE_LOC", "value": "00000000"},
+            {"name": "DEVICE_TYPE_LOC", "value": device_type},
+            *({"name": capability} for capability in capabilities),
+        ]
+    }
+
+
+class SimulatedBridge:
+    """Answers the requests of the library after a random delay, some of them with an error."""
+
+    def __init__(self, latency: float, covers: int, lights: int, switches: int, scenes: int) -> None:
+        self._latency = latency
+        # Fraction of failing requests
+        self.error_rate = 0.0
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.descriptions: dict[str, dict] = {}
+        # "Position" status of the devices: closed percentage of covers, brightness of lights
+        self.positions: dict[str, int] = {}
+        self.rgb: dict[str, str] = {}
+        did = 1
+        for device_type, count, capabilities in (
+            (COVER_TYPE, covers, ("GOTO_POS_CMD",)),
+            (LIGHT_TYPE, lights, ("RGB_CFG",)),
+            (SWITCH_TYPE, switches, ()),
+        ):
+            for _ in range(count):
+                self.descriptions[str(did)] = _description(str(did), device_type, *capabilities)
+                self.positions[str(did)] = 100 if device_type == COVER_TYPE else 0
+                if device_type == LIGHT_TYPE:
+                    self.rgb[str(did)] = "0xFFFFFF"
+                did += 1
+        cover_ids = [did for did in self.descriptions if int(did) <= covers]
+        # Each scene opens a few covers
+        self.scenes = {
+            str(sid): {did: 0 for did in random.sample(cover_ids, min(3, len(cover_ids)))}
+            for sid in range(1, scenes + 1)
+        }
+
+    async def _async_request(self, endpoint: str) -> None:
+        self.requests[endpoint] += 1
+        await asyncio.sleep(random.expovariate(1 / self._latency))
+        if random.random() < self.error_rate:
+            self.errors[endpoint] += 1
+            raise aiohttp.ClientConnectionError("simulated bridge error")
+
+    def _state(self, did: str) -> dict:
+        statuses = {"Position": self.positions[did]}
+        if did in self.rgb:
+            statuses["rgb"] = self.rgb[did]
+        return {"did": did, "statusesMap": statuses, "statusValid": True}
+
+    def api_methods(self) -> dict:
+        """Replacements of the HomePilotApi methods sending requests to the bridge."""
+        bridge = self
+
+        async def get_devices(api):
+            await bridge._async_request("devices")
+            return list(bridge.descriptions.values())
+
+        async def get_device(api, did):
+            await bridge._async_request("device")
+            return bridge.descriptions[did]
+
+        async def async_get_devices_state(api):
+            # One request per device class
+            for devtype in ("Actuator", "Sensor", "Transmitter"):
+                await bridge._async_request(f"devices_state/{devtype}")
+            return {did: bridge._state(did) for did in bridge.descriptions}
+
+        async def async_get_device_state(api, did):
+            await bridge._async_request("device_state")
+            return bridge._state(did)
+
+        async def async_get_fw_status(api):
+            await bridge._async_request("fw_status")
+            return {"update_status": "NO_UPDATE_AVAILABLE", "version": "5.4.9"}
+
+        async def async_get_fw_version(api):
+            await bridge._async_request("fw_version")
+            return {"version": "5.4.9", "df_stick_version": "2.0", "hw_platform": "ampere", "sw_platform": "bridge"}
+
+        async def async_get_interfaces(api):
+            await bridge._async_request("interfaces")
+            return {"interfaces": {"eth0": {"enabled": True, "address": MAC_ADDRESS}}}
+
+        async def async_get_nodename(api):
+            await bridge._async_request("nodename")
+            return {"nodename": "simulated"}
+
+        async def async_get_led_status(api):
+            await bridge._async_request("led_status")
+            return {"status": "enabled"}
+
+        async def async_get_scenes(api):
+            await bridge._async_request("scenes")
+            return [
+                {"id": sid, "name": f"Scene {sid}", "description": "", "is_enabled": 1, "is_manual_executable": 1}
+                for sid in bridge.scenes
+            ]
+
+        def command(endpoint, apply):
+            async def async_command(api, *args):
+                await bridge._async_request(endpoint)
+                apply(*args)
+
+            return async_command
+
+        def set_position(did, position):
+            bridge.positions[did] = position
+
+        def set_rgb(did, rgb):
+            bridge.rgb[did] = rgb
+
+        def execute_scene(sid):
+            bridge.positions.update(bridge.scenes[sid])
+
+        return {
+            "get_devices": get_devices,
+            "get_device": get_device,
+            "async_get_devices_state": async_get_devices_state,
+            "async_get_device_state": async_get_device_state,
+            "async_get_fw_status": async_get_fw_status,
+            "async_get_fw_version": async_get_fw_version,
+            "async_get_interfaces": async_get_interfaces,
+            "async_get_nodename": async_get_nodename,
+            "async_get_led_status": async_get_led_status,
+            "async_get_scenes": async_get_scenes,
+            "async_ping": command("ping", lambda did: None),
+            "async_open_cover": command("command", lambda did: set_position(did, 0)),
+            "async_close_cover": command("command", lambda did: set_position(did, 100)),
+            "async_stop_cover": command("command", lambda did: None),
+            "async_set_position": command("command", set_position),
+            "async_turn_on": command("command", lambda did: set_position(did, bridge.positions[did] or 100)),
+            "async_turn_off": command("command", lambda did: set_position(did, 0)),
+            "async_set_rgb": command("command", set_rgb),
+            "async_execute_scene": command("scene", execute_scene),
+        }
+
+
+def synthetic_trace() -> list[dict]:
+    trace = [{"at": random.random(), "kind": "cover"} for _ in range(50)]
+    trace += [{"at": random.random(), "kind": "light"} for _ in range(20)]
+    trace += [{"at": random.random(), "kind": "switch"} for _ in range(10)]
+    trace += [{"at": random.random(), "kind": "scene"} for _ in range(5)]
+    return sorted(trace, key=lambda command: command["at"])
+
+
+def _service_call(kind: str) -> tuple[str, str, dict]:
+    if kind == "cover":
+        return "cover", random.choice(("open_cover", "close_cover")), {}
+    if kind == "light":
+        return "light", "turn_on", {
+            "brightness": random.randint(1, 255),
+            "rgb_color": [random.randint(0, 255) for _ in range(3)],
+        }
+    if kind == "switch":
+        return "switch", random.choice(("turn_on", "turn_off")), {}
+    return "scene", "turn_on", {}
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    if not values:
+        return None
+    return round(values[min(int(fraction * len(values)), len(values) - 1)], 3)
+
+
+async def async_replay(trace: list[dict], bridge: SimulatedBridge, error_rate: float, settle: float) -> dict:
+    with tempfile.TemporaryDirectory() as config_dir, patch.multiple(HomePilotApi, **bridge.api_methods()):
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Load the integration from this repository
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                version=3,
+                unique_id=MAC_ADDRESS.replace(":", ""),
+                data={CONF_HOST: "bridge.local", CONF_PASSWORD: "", CONF_API_VERSION: 1},
+            )
+            entry.add_to_hass(hass)
+            if not await hass.config_entries.async_setup(entry.entry_id):
+                raise RuntimeError("Setup of the integration failed")
+            await hass.async_block_till_done()
+
+            # The device entities, not the configuration switches of the devices
+            device_uids = {f"sim_{did}" for did in bridge.descriptions}
+            entities: dict[str, list[str]] = {kind: [] for kind in KINDS}
+            for registry_entry in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id):
+                if registry_entry.domain == "scene" or registry_entry.unique_id in device_uids:
+                    entities[registry_entry.domain].append(registry_entry.entity_id)
+
+            # Requests fail during the replay only, the setup would be retried
+            setup_requests = sum(bridge.requests.values())
+            bridge.requests.clear()
+            bridge.error_rate = error_rate
+            latencies: dict[str, list[float]] = {kind: [] for kind in KINDS}
+            errors: Counter[str] = Counter()
+
+            async def async_command(command: dict) -> None:
+                await asyncio.sleep(command["at"])
+                kind = command["kind"]
+                domain, service, data = _service_call(kind)
+                entity_id = random.choice(entities[kind])
+                started = time.monotonic()
+                try:
+                    await hass.services.async_call(
+                        domain, service, {"entity_id": entity_id, **data}, blocking=True
+                    )
+                except (HomeAssistantError, aiohttp.ClientError):
+                    errors[kind] += 1
+                latencies[kind].append(time.monotonic() - started)
+
+            started = time.monotonic()
+            await asyncio.gather(*(async_command(command) for command in trace if entities[command["kind"]]))
+            burst = time.monotonic() - started
+            # The refreshes planned by the entities and the scene completions
+            await asyncio.sleep(settle)
+            await hass.async_block_till_done()
+
+            report = {}
+            for kind, values in latencies.items():
+                if not values:
+                    continue
+                values.sort()
+                report[kind] = {
+                    "count": len(values),
+                    "errors": errors[kind],
+                    "error_rate": round(errors[kind] / len(values), 3),
+                    "latency_p50": _percentile(values, 0.5),
+                    "latency_p95": _percentile(values, 0.95),
+                    "latency_max": round(values[-1], 3),
+                }
+            requests = sum(bridge.requests.values())
+            statistics = hass.data[DOMAIN][entry.entry_id].scheduler.statistics()
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    return {
+        "commands": report,
+        "burst_duration": round(burst, 3),
+        "setup_requests": setup_requests,
+        "bridge_requests": requests,
+        # Refreshes of all device states, one request per device class each
+        "full_refreshes": bridge.requests["devices_state/Actuator"],
+        "bridge_requests_by_endpoint": dict(sorted(bridge.requests.items())),
+        "bridge_error_rate": round(sum(bridge.errors.values()) / requests, 3) if requests else None,
+        "bridge": statistics,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", type=Path, help="JSON file of the commands to replay")
+    parser.add_argument("--latency", type=float, default=0.08, help="mean bridge response time (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of failing requests")
+    parser.add_argument("--settle", type=float, default=15.0, help="time (s) for the refreshes after the burst")
+    parser.add_argument("--covers", type=int, default=20)
+    parser.add_argument("--lights", type=int, default=5)
+    parser.add_argument("--switches", type=int, default=5)
+    parser.add_argument("--scenes", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.ERROR)
+    random.seed(args.seed)
+    trace = json.loads(args.trace.read_text()) if args.trace else synthetic_trace()
+    bridge = SimulatedBridge(args.latency, args.covers, args.lights, args.switches, args.scenes)
+    print(json.dumps(asyncio.run(async_replay(trace, bridge, args.error_rate, args.settle)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
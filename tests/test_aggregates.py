@@ -0,0 +1,74 @@
+"""Tests for the lowest battery level of the hub aggregates."""
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.rademacher.aggregates import DeviceAggregates
+
+
+class FakeDeviceStates(dict):
+    """Devices with the ones changed by the last refresh."""
+
+    changed_devices: set[str] = set()
+
+    def refresh(self, *dids):
+        self.changed_devices = set(dids) if dids else set(self)
+
+
+def battery_device(level):
+    return SimpleNamespace(available=True, has_battery_level=True, battery_level_value=level)
+
+
+@pytest.fixture
+def device_states():
+    device_states = FakeDeviceStates(
+        {"1": battery_device(80), "2": battery_device(30), "3": battery_device(50)}
+    )
+    device_states.refresh()
+    return device_states
+
+
+def test_lowest_battery_follows_changes(device_states):
+    aggregates = DeviceAggregates(device_states, [])
+    assert aggregates.lowest_battery is None
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (30, "2")
+    device_states["2"].battery_level_value = 90
+    device_states.refresh("2")
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (50, "3")
+    device_states["3"].available = False
+    device_states["1"].battery_level_value = None
+    device_states.refresh("1", "3")
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (90, "2")
+    device_states["2"].available = False
+    device_states.refresh("2")
+    aggregates.async_update()
+    assert aggregates.lowest_battery is None
+
+
+def test_only_changed_and_included_devices_counted(device_states):
+    aggregates = DeviceAggregates(device_states, ["2"])
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (50, "3")
+    # Not reported as changed by the refresh
+    device_states["1"].battery_level_value = 10
+    device_states.refresh("3")
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (50, "3")
+
+
+def test_outdated_heap_entries_bounded(device_states):
+    aggregates = DeviceAggregates(device_states, [])
+    aggregates.async_update()
+    for level in range(100, 0, -1):
+        device_states["1"].battery_level_value = level
+        device_states.refresh("1")
+        aggregates.async_update()
+        assert len(aggregates._battery_heap) <= 2 * 3 + 16
+    assert aggregates.lowest_battery == (1, "1")
+    device_states["1"].battery_level_value = 100
+    device_states.refresh("1")
+    aggregates.async_update()
+    assert aggregates.lowest_battery == (30, "2")
@@ -0,0 +1,53 @@
+"""Tests for the travel-time model of the covers."""
+import pytest
+
+from custom_components.rademacher.cover import DEFAULT_TRAVEL_TIME, STALL_TIME, CoverTravelModel
+
+
+def test_interpolated_position():
+    model = CoverTravelModel(travel_time=20.0)
+    model.start(0, 100, now=0.0)
+    assert model.direction == 1
+    assert model.position(5.0) == 25
+    assert model.position(30.0) == 100
+    assert model.remaining_time(5.0) == pytest.approx(15.0)
+    model.stop()
+    assert not model.is_moving
+    assert model.position(5.0) is None
+
+
+def test_learns_from_intermediate_position():
+    model = CoverTravelModel()
+    model.start(100, 0, now=0.0)
+    # 50 % in 5 s: a full travel takes 10 s, smoothed with the default
+    assert model.observe(50, 5.0)
+    assert model.travel_time == pytest.approx((DEFAULT_TRAVEL_TIME + 10.0) / 2)
+    assert model.position(5.0) == 50
+
+
+def test_short_motion_not_learned():
+    model = CoverTravelModel()
+    model.start(50, 40, now=0.0)
+    assert model.observe(45, 1.0)
+    assert model.travel_time == DEFAULT_TRAVEL_TIME
+
+
+def test_stalled_position():
+    model = CoverTravelModel()
+    model.start(0, 100, now=0.0)
+    assert model.observe(20, 5.0)
+    assert model.observe(20, 5.0 + STALL_TIME / 2)
+    assert not model.observe(20, 5.0 + STALL_TIME)
+
+
+def test_reversed_position():
+    model = CoverTravelModel()
+    model.start(50, 100, now=0.0)
+    assert not model.observe(40, 1.0)
+
+
+def test_target_reached():
+    model = CoverTravelModel()
+    model.start(0, 100, now=0.0)
+    assert model.observe(100, 1.0)
+    assert model.travel_time == DEFAULT_TRAVEL_TIME
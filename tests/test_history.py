@@ -0,0 +1,29 @@
+"""Tests for the sensor history ring buffer."""
+from custom_components.rademacher.history import SensorHistory
+
+
+def test_aggregate_empty():
+    assert SensorHistory(4).aggregate(100.0, 60) is None
+
+
+def test_aggregate_window():
+    history = SensorHistory(10)
+    for timestamp, value in ((0.0, 5.0), (50.0, 1.0), (60.0, 3.0), (70.0, 2.0)):
+        history.append(timestamp, value)
+    assert history.aggregate(70.0, 20) == (1.0, 3.0, 2.0)
+    assert history.aggregate(200.0, 20) is None
+
+
+def test_aggregate_increasing_values():
+    history = SensorHistory(10)
+    for timestamp, value in ((0.0, 1.0), (1.0, 2.0), (2.0, 3.0)):
+        history.append(timestamp, value)
+    assert history.aggregate(2.0, 10) == (1.0, 3.0, 2.0)
+
+
+def test_oldest_sample_overwritten():
+    history = SensorHistory(3)
+    for timestamp in range(5):
+        history.append(float(timestamp), float(timestamp))
+    assert len(history) == 3
+    assert history.aggregate(4.0, 100) == (2.0, 4.0, 3.0)
@@ -0,0 +1,84 @@
+"""Tests for the execution order of scenes and the devices learned from them."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homepilot.cover import HomePilotCover
+import pytest
+
+from custom_components.rademacher import scene_index as scene_index_module
+from custom_components.rademacher.scene_executor import SceneExecutor
+from custom_components.rademacher.scene_index import SceneDeviceIndex
+
+
+@pytest.fixture
+def devices():
+    devices = {}
+    for did in ("1", "2", "3"):
+        device = devices[did] = MagicMock(spec=HomePilotCover)
+        device.available = True
+        device.cover_position = 0
+    return devices
+
+
+@pytest.fixture
+def scene_index(monkeypatch, devices):
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    monkeypatch.setattr(scene_index_module, "Store", MagicMock(return_value=store))
+    index = SceneDeviceIndex(MagicMock(), MagicMock())
+    scenes = {sid: MagicMock() for sid in ("a", "b", "c", "d")}
+    asyncio.run(index.async_load(scenes, devices))
+    return index
+
+
+@pytest.fixture
+def executor(scene_index, devices):
+    manager = MagicMock()
+    manager.devices = devices
+    return SceneExecutor(MagicMock(), MagicMock(), manager, MagicMock(), MagicMock(), scene_index)
+
+
+def test_scenes_without_shared_devices_in_one_wave(scene_index, executor):
+    scene_index.async_update_devices("a", ["1"])
+    scene_index.async_update_devices("b", ["2"])
+    assert executor._execution_waves(["a", "b", "c"]) == [[0, 1, 2]]
+
+
+def test_scenes_sharing_devices_in_later_waves(scene_index, executor):
+    scene_index.async_update_devices("a", ["1"])
+    scene_index.async_update_devices("b", ["1", "2"])
+    scene_index.async_update_devices("c", ["3"])
+    scene_index.async_update_devices("d", ["2"])
+    # b waits for a, d for b, c and the unknown scene run at once with a
+    assert executor._execution_waves(["a", "b", "c", "d", "e"]) == [[0, 2, 4], [1], [3]]
+
+
+def test_scenes_sharing_devices_keep_the_given_order(scene_index, executor):
+    scene_index.async_update_devices("a", ["1"])
+    scene_index.async_update_devices("b", ["1"])
+    assert executor._execution_waves(["b", "a"]) == [[0], [1]]
+
+
+def test_unchanged_devices_kept_without_known_target(scene_index, executor):
+    executor._async_learn_devices("a", set(), {"1", "2"})
+    assert scene_index.devices("a") == {"1", "2"}
+    # Devices already in their target state don't change
+    executor._async_learn_devices("a", {"1", "2"}, {"2"})
+    assert scene_index.devices("a") == {"1", "2"}
+
+
+def test_unchanged_device_in_another_state_dropped(scene_index, executor, devices):
+    executor._async_learn_devices("a", set(), {"1", "2"})
+    devices["1"].cover_position = 50
+    devices["2"].cover_position = 50
+    devices["2"].available = False
+    executor._async_learn_devices("a", {"1", "2"}, {"3"})
+    # Unavailable devices don't tell whether the scene still controls them
+    assert scene_index.devices("a") == {"2", "3"}
+
+
+def test_scene_unknown_again_without_devices(scene_index, executor, devices):
+    executor._async_learn_devices("a", set(), {"1"})
+    devices["1"].cover_position = 50
+    executor._async_learn_devices("a", {"1"}, set())
+    assert "a" not in scene_index
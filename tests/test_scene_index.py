@@ -0,0 +1,83 @@
+"""Tests for the index of the devices controlled by the scenes."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homepilot.cover import HomePilotCover
+import pytest
+
+from custom_components.rademacher import scene_index as scene_index_module
+from custom_components.rademacher.scene_index import SceneDeviceIndex
+
+
+def make_index(monkeypatch, stored=None):
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=stored)
+    monkeypatch.setattr(scene_index_module, "Store", MagicMock(return_value=store))
+    index = SceneDeviceIndex(MagicMock(), MagicMock())
+    # Device 4 is a sensor, scenes never control it
+    devices = {did: MagicMock(spec=HomePilotCover) for did in ("1", "2", "3")}
+    devices["4"] = MagicMock()
+    scenes = {sid: MagicMock() for sid in ("a", "b")}
+    asyncio.run(index.async_load(scenes, devices))
+    return index, store
+
+
+@pytest.fixture
+def index(monkeypatch):
+    return make_index(monkeypatch)[0]
+
+
+def test_stored_devices_filtered_on_load(monkeypatch):
+    index, _ = make_index(monkeypatch, {"a": ["1", "4", "9"], "c": ["2"]})
+    assert index.devices("a") == {"1"}
+    assert "c" not in index
+    assert index.scenes("1") == {"a"}
+
+
+def test_devices_accumulated(index):
+    index.async_update_devices("a", ["1"])
+    index.async_update_devices("a", ["2", "4"])
+    assert index.devices("a") == {"1", "2"}
+    assert index.scenes("2") == {"a"}
+    assert index.scenes("4") == frozenset()
+
+
+def test_removed_devices_dropped(index):
+    index.async_update_devices("a", ["1", "2"])
+    index.async_update_devices("b", ["2"])
+    index.async_update_devices("a", ["3"], ["2"])
+    assert index.devices("a") == {"1", "3"}
+    assert index.scenes("2") == {"b"}
+    index.async_update_devices("a", [], ["1", "3"])
+    # Without devices the scene is unknown again
+    assert "a" not in index
+    assert index.scenes("1") == frozenset()
+
+
+def test_unknown_scene_without_devices_not_recorded(index):
+    index.async_update_devices("a", ["4"])
+    assert "a" not in index
+    assert index.size == 0
+
+
+def test_conflicts(index):
+    index.async_update_devices("a", ["1", "2"])
+    index.async_update_devices("b", ["2", "3"])
+    assert index.conflicts(["a", "b"]) == {"2": ["a", "b"]}
+    assert index.conflicts(["a"]) == {}
+
+
+def test_changes_saved_and_notified(monkeypatch):
+    index, store = make_index(monkeypatch)
+    update_callback = MagicMock()
+    remove_listener = index.async_add_listener("a", update_callback)
+    index.async_update_devices("a", ["1"])
+    index.async_update_devices("a", ["1"])
+    assert update_callback.call_count == 1
+    assert store.async_delay_save.call_count == 1
+    assert store.async_delay_save.call_args[0][0]() == {"a": ["1"]}
+    index.async_remove_scene("a")
+    assert update_callback.call_count == 2
+    remove_listener()
+    index.async_update_devices("a", ["2"])
+    assert update_callback.call_count == 2
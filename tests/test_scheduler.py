@@ -0,0 +1,151 @@
+"""Tests for the prioritized access to the bridge."""
+import asyncio
+
+import pytest
+
+from custom_components.rademacher.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_COMMAND,
+    PRIORITY_REFRESH,
+    BridgeScheduler,
+)
+
+
+def test_waiting_operations_served_by_priority():
+    async def run():
+        scheduler = BridgeScheduler(max_in_flight=1)
+        order = []
+        release = asyncio.Event()
+
+        async def operation(name, priority, wait=False):
+            async with scheduler.slot(priority):
+                order.append(name)
+                if wait:
+                    await release.wait()
+
+        first = asyncio.create_task(operation("first", PRIORITY_BACKGROUND, wait=True))
+        await asyncio.sleep(0)
+        others = [
+            asyncio.create_task(operation("background", PRIORITY_BACKGROUND)),
+            asyncio.create_task(operation("refresh", PRIORITY_REFRESH)),
+            asyncio.create_task(operation("command", PRIORITY_COMMAND)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.in_flight == 1
+        assert scheduler.waiting == 3
+        release.set()
+        await asyncio.gather(first, *others)
+        assert scheduler.in_flight == 0
+        return order
+
+    assert asyncio.run(run()) == ["first", "command", "refresh", "background"]
+
+
+def test_cancelled_waiter_releases_nothing():
+    async def run():
+        scheduler = BridgeScheduler(max_in_flight=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with scheduler.slot(PRIORITY_REFRESH):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.waiting == 0
+        release.set()
+        await holder
+        return scheduler.in_flight
+
+    assert asyncio.run(run()) == 0
+
+
+def test_identical_fetches_shared():
+    async def run():
+        scheduler = BridgeScheduler()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *(scheduler.async_fetch(("device_states",), PRIORITY_REFRESH, fetch) for _ in range(3))
+        )
+        return calls, results
+
+    assert asyncio.run(run()) == (1, [1, 1, 1])
+
+
+def test_cancelled_caller_keeps_shared_fetch():
+    async def run():
+        scheduler = BridgeScheduler()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "states"
+
+        first = asyncio.create_task(scheduler.async_fetch(("device_states",), PRIORITY_REFRESH, fetch))
+        second = asyncio.create_task(scheduler.async_fetch(("device_states",), PRIORITY_REFRESH, fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        release.set()
+        return await second
+
+    assert asyncio.run(run()) == "states"
+
+
+def test_fetch_cancelled_with_last_caller():
+    async def run():
+        scheduler = BridgeScheduler(max_in_flight=1)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def hung_fetch():
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.01):
+                await scheduler.async_fetch(("device_states",), PRIORITY_REFRESH, hung_fetch)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        async def fetch():
+            return "states"
+
+        # The slot is free again and the key is not joined to the cancelled fetch
+        return started.is_set(), await scheduler.async_fetch(("device_states",), PRIORITY_REFRESH, fetch)
+
+    assert asyncio.run(run()) == (True, "states")
+
+
+def test_statistics():
+    async def run():
+        scheduler = BridgeScheduler()
+        async with scheduler.slot(PRIORITY_COMMAND):
+            pass
+        with pytest.raises(RuntimeError):
+            async with scheduler.slot(PRIORITY_COMMAND):
+                raise RuntimeError
+        return scheduler.statistics()
+
+    statistics = asyncio.run(run())
+    assert statistics["command"]["count"] == 2
+    assert statistics["command"]["errors"] == 1
+    assert statistics["command"]["error_rate"] == 0.5
+    # Priorities without operations are left out
+    assert "refresh" not in statistics
@@ -0,0 +1,54 @@
+"""Tests for the deadband filter of the sensors."""
+from custom_components.rademacher.sensor import DeadbandFilter
+
+
+def test_first_reading_accepted():
+    value_filter = DeadbandFilter(absolute=1)
+    assert value_filter.async_accept(20.0, 0.0)
+    assert not value_filter.async_accept(20.0, 1.0)
+
+
+def test_absolute_deadband():
+    value_filter = DeadbandFilter(absolute=0.1)
+    assert value_filter.async_accept(22.6, 0.0)
+    assert not value_filter.async_accept(22.65, 1.0)
+    # 22.7 - 22.6 is slightly below 0.1 in binary floats
+    assert value_filter.async_accept(22.7, 2.0)
+
+
+def test_relative_deadband():
+    value_filter = DeadbandFilter(absolute=2, relative=0.05)
+    assert value_filter.async_accept(1000, 0.0)
+    assert not value_filter.async_accept(1040, 1.0)
+    assert value_filter.async_accept(1050, 2.0)
+    assert not value_filter.async_accept(1048, 3.0)
+
+
+def test_hysteresis_on_reversal():
+    value_filter = DeadbandFilter(absolute=1, hysteresis=1)
+    assert value_filter.async_accept(10, 0.0)
+    assert value_filter.async_accept(11, 1.0)
+    assert not value_filter.async_accept(10, 2.0)
+    assert value_filter.async_accept(9, 3.0)
+
+
+def test_silent_interval():
+    value_filter = DeadbandFilter(absolute=1, max_silent_interval=60)
+    assert value_filter.async_accept(10.0, 0.0)
+    assert not value_filter.async_accept(10.5, 30.0)
+    assert value_filter.async_accept(10.5, 60.0)
+
+
+def test_scale():
+    value_filter = DeadbandFilter(absolute=1, scale=0)
+    assert value_filter.async_accept(10.0, 0.0)
+    assert value_filter.async_accept(10.01, 1.0)
+    assert not value_filter.async_accept(10.01, 2.0)
+
+
+def test_non_numeric_values():
+    value_filter = DeadbandFilter(absolute=1)
+    assert value_filter.async_accept(10, 0.0)
+    assert value_filter.async_accept(None, 1.0)
+    assert not value_filter.async_accept(None, 2.0)
+    assert value_filter.async_accept(10, 3.0)
@@ -0,0 +1,92 @@
+"""Tests for the debounced write-through cache."""
+import asyncio
+
+import pytest
+
+from custom_components.rademacher import write_cache
+from custom_components.rademacher.write_cache import WriteThroughCache
+
+
+@pytest.fixture
+def scheduled(monkeypatch):
+    """Flushes planned by the cache, run by the test instead of a timer."""
+    flushes = []
+
+    def fake_call_later(hass, delay, action):
+        flushes.append(action)
+        return lambda: flushes.remove(action)
+
+    monkeypatch.setattr(write_cache, "async_call_later", fake_call_later)
+    return flushes
+
+
+def test_only_last_value_written(scheduled):
+    written = []
+
+    async def async_write(value):
+        written.append(value)
+
+    cache = WriteThroughCache(async_write, verify_after=10)
+    cache.async_set(None, 20.0)
+    cache.async_set(None, 21.0)
+    assert cache.has_value and cache.value == 21.0
+    assert len(scheduled) == 1
+    asyncio.run(scheduled.pop()(None))
+    assert written == [21.0]
+    assert cache.has_value
+
+
+def test_value_kept_while_writing(scheduled):
+    observed = []
+    cache = None
+
+    async def async_write(value):
+        observed.append(cache.has_value)
+
+    cache = WriteThroughCache(async_write, verify_after=10)
+    cache.async_set(None, 20.0)
+    asyncio.run(scheduled.pop()(None))
+    assert observed == [True]
+
+
+def test_verified_by_device(scheduled):
+    async def async_write(value):
+        pass
+
+    cache = WriteThroughCache(async_write, verify_after=10)
+    cache.async_set(None, 20.0)
+    asyncio.run(scheduled.pop()(None))
+    cache.async_verify(19.0)
+    assert cache.has_value
+    cache.async_verify(20.0)
+    assert not cache.has_value
+
+
+def test_failed_write(scheduled):
+    failures = []
+    cache = None
+
+    async def async_write(value):
+        raise ConnectionError
+
+    cache = WriteThroughCache(
+        async_write, verify_after=10, on_failure=lambda: failures.append(cache.has_value)
+    )
+    cache.async_set(None, 20.0)
+    asyncio.run(scheduled.pop()(None))
+    assert failures == [False]
+    assert not cache.has_value
+
+
+def test_failed_write_keeps_newer_value(scheduled):
+    cache = None
+
+    async def async_write(value):
+        cache.async_set(None, 22.0)
+        raise ConnectionError
+
+    cache = WriteThroughCache(async_write, verify_after=10)
+    cache.async_set(None, 20.0)
+    asyncio.run(scheduled.pop()(None))
+    assert cache.has_value and cache.value == 22.0
+    assert len(scheduled) == 1